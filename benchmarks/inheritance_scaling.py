@@ -0,0 +1,102 @@
+"""Times ancestor and descendant lookups for every class of synthetic
+schemas, with the schema index and with the linear scans it replaced.
+
+Each class gets a random superclass among the classes before it, which
+gives hierarchies of logarithmic depth, like real ones.
+
+"build" is parsing and compiling the schema, which includes indexing it.
+
+Usage: uv run python benchmarks/inheritance_scaling.py [CLASS_COUNT ...]
+"""
+
+import random
+import sys
+import time
+
+from linkml_asciidoc_generator.linkml.compile import compile_linkml_schema
+from linkml_asciidoc_generator.linkml.model import CompiledClass, CompiledSchema
+from linkml_asciidoc_generator.linkml.parse import ParseMode, parse_linkml_schema
+from linkml_asciidoc_generator.linkml.query import get_ancestors, get_descendants
+
+
+CLASS_COUNTS = [1_000, 10_000, 50_000]
+
+# The linear scans are quadratic overall; beyond this they take minutes.
+MAX_LINEAR_CLASS_COUNT = 10_000
+
+
+def _get_synthetic_schema(class_count: int) -> CompiledSchema:
+    rng = random.Random(class_count)
+
+    classes = {"C0": {}}
+    for i in range(1, class_count):
+        classes[f"C{i}"] = {"is_a": f"C{rng.randrange(i)}"}
+
+    return compile_linkml_schema(
+        parse_linkml_schema(
+            {"id": "https://example.org/synthetic", "name": "synthetic", "classes": classes},
+            ParseMode.TRUSTED,
+        )
+    )
+
+
+def _get_descendants_linear(
+    class_: CompiledClass, schema: CompiledSchema
+) -> list[CompiledClass]:
+    return list(filter(lambda c: c.parent is class_, schema.classes.values()))
+
+
+def _get_ancestors_linear(class_: CompiledClass) -> list[CompiledClass]:
+    ancestors = []
+    while class_.parent is not None:
+        ancestors.append(class_.parent)
+        class_ = class_.parent
+
+    return ancestors
+
+
+def _time_indexed(schema: CompiledSchema) -> float:
+    start = time.perf_counter()
+    for class_ in schema.classes.values():
+        get_ancestors(class_, schema)
+        get_descendants(class_, schema)
+
+    return time.perf_counter() - start
+
+
+def _time_linear(schema: CompiledSchema) -> float:
+    start = time.perf_counter()
+    for class_ in schema.classes.values():
+        _get_ancestors_linear(class_)
+        _get_descendants_linear(class_, schema)
+
+    return time.perf_counter() - start
+
+
+def main(class_counts: list[int]) -> None:
+    print(
+        f"{'classes':>8} {'build s':>10} {'indexed s':>10} {'per class µs':>13}"
+        f" {'linear s':>9} {'per class µs':>13}"
+    )
+
+    for class_count in class_counts:
+        start = time.perf_counter()
+        schema = _get_synthetic_schema(class_count)
+        build_s = time.perf_counter() - start
+
+        indexed_s = _time_indexed(schema)
+
+        if class_count <= MAX_LINEAR_CLASS_COUNT:
+            linear_s = _time_linear(schema)
+            linear = f" {linear_s:>9.3f} {linear_s / class_count * 1e6:>13.1f}"
+        else:
+            linear = f" {'-':>9} {'-':>13}"
+
+        print(
+            f"{class_count:>8} {build_s:>10.3f} {indexed_s:>10.3f}"
+            f" {indexed_s / class_count * 1e6:>13.1f}" + linear
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or CLASS_COUNTS)
@@ -0,0 +1,80 @@
+"""Measures the memory held by parsed (and compiled) schemas with and without
+interning names and references while parsing.
+
+Every measurement runs in a fresh interpreter, so the interned strings
+table starts out the same for each.
+
+Usage: uv run python benchmarks/interning.py [SCHEMA ...]
+"""
+
+import gc
+import multiprocessing
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from linkml_asciidoc_generator.linkml import parse
+from linkml_asciidoc_generator.linkml.read import read_linkml_schema
+from linkml_asciidoc_generator.linkml.compile import compile_linkml_schema
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SCHEMA_FILES = [
+    DATA_DIR / "TC57CIM.yml",
+    DATA_DIR / "TC57CIM.IEC61970.yaml",
+    DATA_DIR / "core-equipment.yaml",
+]
+
+
+def _measure(schema_file: Path, interned: bool) -> tuple[int, int]:
+    """Memory held by the parsed schema, and by it and its compiled form."""
+
+    if not interned:
+        parse.intern_schema_strings = lambda schema: None
+
+    gc.collect()
+    tracemalloc.start()
+
+    schema = parse.parse_linkml_schema(read_linkml_schema(schema_file))
+    gc.collect()
+    parsed, _ = tracemalloc.get_traced_memory()
+
+    compiled_schema = compile_linkml_schema(schema)
+    gc.collect()
+    compiled, _ = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+    del schema, compiled_schema
+
+    return parsed, compiled
+
+
+def _measure_in_new_process(schema_file: Path, interned: bool) -> tuple[int, int]:
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure, schema_file, interned).result()
+
+
+def main(schema_files: list[Path]) -> None:
+    print(
+        f"{'schema':<24} {'stage':<16} {'plain MiB':>9} {'interned MiB':>12} {'saved':>6}"
+    )
+
+    for schema_file in schema_files:
+        plain = _measure_in_new_process(schema_file, interned=False)
+        interned = _measure_in_new_process(schema_file, interned=True)
+
+        for stage, plain_size, interned_size in zip(
+            ("parse", "parse + compile"), plain, interned
+        ):
+            print(
+                f"{schema_file.name:<24} {stage:<16}"
+                f" {plain_size / 2**20:>9.1f} {interned_size / 2**20:>12.1f}"
+                f" {1 - interned_size / plain_size:>6.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or SCHEMA_FILES)
@@ -0,0 +1,76 @@
+"""Compares loading a schema from YAML through a dictionary with loading it
+from JSON through `model_validate_json`.
+
+Usage: uv run python benchmarks/json_ingestion.py [SCHEMA ...]
+"""
+
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable
+
+from linkml_asciidoc_generator.linkml.read import (
+    convert_linkml_schema_to_json,
+    read_linkml_schema,
+)
+from linkml_asciidoc_generator.linkml.parse import (
+    parse_linkml_schema,
+    parse_linkml_schema_json,
+)
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SCHEMA_FILES = [
+    DATA_DIR / "TC57CIM.yml",
+    DATA_DIR / "core-equipment.yaml",
+]
+REPEAT = 3
+
+
+def _measure(load: Callable[[], object]) -> tuple[float, int]:
+    seconds = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        load()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    schema = load()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del schema
+
+    return seconds, peak
+
+
+def main(schema_files: list[Path]) -> None:
+    print(f"{'schema':<24} {'path':<32} {'s':>8} {'peak MiB':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for schema_file in schema_files:
+            json_file = Path(tmp_dir) / f"{schema_file.stem}.json"
+            convert_linkml_schema_to_json(schema_file, json_file)
+            schema_dict = read_linkml_schema(schema_file)
+
+            paths = {
+                "yaml: read + model_validate": lambda: parse_linkml_schema(
+                    read_linkml_schema(schema_file)
+                ),
+                "dict: model_validate": lambda: parse_linkml_schema(schema_dict),
+                "json: model_validate_json": lambda: parse_linkml_schema_json(
+                    json_file.read_bytes()
+                ),
+            }
+
+            for path, load in paths.items():
+                seconds, peak = _measure(load)
+                print(
+                    f"{schema_file.name:<24} {path:<32}"
+                    f" {seconds:>8.3f} {peak / 2**20:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or SCHEMA_FILES)
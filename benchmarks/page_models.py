@@ -0,0 +1,111 @@
+"""Measures the memory and the number of objects of the documentation model
+of a schema, with and without sharing the models of relation targets and
+inherited slots between pages.
+
+Every measurement runs in a fresh interpreter.
+
+Usage: uv run python benchmarks/page_models.py [SCHEMA ...]
+"""
+
+import dataclasses
+import gc
+import multiprocessing
+import sys
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from linkml_asciidoc_generator.main import DEFAULT_TEMPLATES_DIR
+from linkml_asciidoc_generator.linkml.load import load_linkml_schema
+from linkml_asciidoc_generator.linkml.compile import compile_linkml_schema
+from linkml_asciidoc_generator.asciidoc.class_page import generate
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.generate import (
+    generate_linkml_documentation,
+)
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SCHEMA_FILES = [
+    DATA_DIR / "TC57CIM.yml",
+    DATA_DIR / "core-equipment.yaml",
+]
+
+CONFIG = {
+    "templates": {
+        "dir": DEFAULT_TEMPLATES_DIR,
+        "class_page": "class_page/class_page.adoc.jinja2",
+        "enumeration_page": "enumeration_page.adoc.jinja2",
+        "cim_data_type_page": "class_page/cim_data_type_page.adoc.jinja2",
+        "type_page": "type_page.adoc.jinja2",
+        "class_page_relations_diagram": "class_page/relations_diagram.adoc.jinja2",
+        "index_page": "index_page.adoc.jinja2",
+        "navigation_page": "navigation_page.adoc.jinja2",
+    },
+    "diagrams": {"relations": False},
+    "cache": {"enabled": False},
+}
+
+
+def _count_models(model) -> int:
+    """The number of distinct page model objects reachable from the model."""
+
+    seen = set()
+    pending = [model]
+    while pending:
+        obj = pending.pop()
+        if dataclasses.is_dataclass(obj):
+            if id(obj) in seen:
+                continue
+            seen.add(id(obj))
+            pending.extend(getattr(obj, f.name) for f in dataclasses.fields(obj))
+        elif isinstance(obj, (list, tuple)):
+            pending.extend(obj)
+        elif isinstance(obj, dict):
+            pending.extend(obj.values())
+
+    return len(seen)
+
+
+def _measure(schema_file: Path, shared: bool) -> tuple[int, int, int]:
+    """Peak memory while generating, memory held by the documentation model
+    and the number of model objects in it."""
+
+    if not shared:
+        generate._get_shared_model = lambda schema, key, create: create()
+
+    schema = compile_linkml_schema(load_linkml_schema(schema_file, CONFIG))
+
+    gc.collect()
+    tracemalloc.start()
+
+    documentation = generate_linkml_documentation(schema, CONFIG)
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.stop()
+
+    return peak, held, _count_models(documentation)
+
+
+def _measure_in_new_process(schema_file: Path, shared: bool) -> tuple[int, int, int]:
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        return executor.submit(_measure, schema_file, shared).result()
+
+
+def main(schema_files: list[Path]) -> None:
+    print(
+        f"{'schema':<24}{'models':>10}{'peak MiB':>10}{'held MiB':>10}{'objects':>10}"
+    )
+    for schema_file in schema_files:
+        for shared in (False, True):
+            peak, held, objects = _measure_in_new_process(schema_file, shared)
+            print(
+                f"{schema_file.name:<24}{'shared' if shared else 'per page':>10}"
+                f"{peak / 2**20:>10.1f}{held / 2**20:>10.1f}{objects:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or SCHEMA_FILES)
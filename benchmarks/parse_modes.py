@@ -0,0 +1,74 @@
+"""Compares the parse modes and metamodels on the bundled schemas.
+
+Usage: uv run python benchmarks/parse_modes.py [SCHEMA ...]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from linkml_asciidoc_generator.linkml.read import read_linkml_schema
+from linkml_asciidoc_generator.linkml.parse import ParseMode, parse_linkml_schema
+from linkml_asciidoc_generator.linkml.model import Metamodel
+
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+SCHEMA_FILES = [
+    DATA_DIR / "TC57CIM.yml",
+    DATA_DIR / "TC57CIM.IEC61970.yaml",
+    DATA_DIR / "core-equipment.yaml",
+    DATA_DIR / "dp_meetdata.yaml",
+    DATA_DIR / "dp_nbl_forecast.yaml",
+    DATA_DIR / "dp_eh_nettopologie.yaml",
+    DATA_DIR / "im_capaciteitskaart.yaml",
+]
+REPEAT = 3
+
+
+def _measure(
+    schema_dict: dict, mode: ParseMode, metamodel: Metamodel
+) -> tuple[float, int]:
+    seconds = min(_time(schema_dict, mode, metamodel) for _ in range(REPEAT))
+
+    tracemalloc.start()
+    schema = parse_linkml_schema(schema_dict, mode, metamodel)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del schema
+
+    return seconds, peak
+
+
+def _time(schema_dict: dict, mode: ParseMode, metamodel: Metamodel) -> float:
+    start = time.perf_counter()
+    parse_linkml_schema(schema_dict, mode, metamodel)
+
+    return time.perf_counter() - start
+
+
+def main(schema_files: list[Path]) -> None:
+    print(
+        f"{'schema':<28} {'metamodel':<10} {'strict s':>9} {'trusted s':>9}"
+        f" {'speedup':>8} {'strict MiB':>10} {'trusted MiB':>11}"
+    )
+
+    for schema_file in schema_files:
+        schema_dict = read_linkml_schema(schema_file)
+
+        for metamodel in Metamodel:
+            strict_s, strict_mem = _measure(schema_dict, ParseMode.STRICT, metamodel)
+            trusted_s, trusted_mem = _measure(
+                schema_dict, ParseMode.TRUSTED, metamodel
+            )
+
+            print(
+                f"{schema_file.name:<28} {metamodel.value:<10}"
+                f" {strict_s:>9.3f} {trusted_s:>9.3f}"
+                f" {strict_s / trusted_s:>7.1f}x"
+                f" {strict_mem / 2**20:>10.1f} {trusted_mem / 2**20:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main([Path(arg) for arg in sys.argv[1:]] or SCHEMA_FILES)
@@ -1,5 +1,6 @@
 import os.path
 from dataclasses import dataclass
+from functools import cache
 from os import PathLike
 from enum import Enum, auto
 from typing import NamedTuple
@@ -10,13 +11,15 @@ from rdflib import Graph, URIRef, SKOS
 from linkml_asciidoc_generator.linkml.model import (
     LinkMLElementName,
     LinkMLPrimitive,
-    LinkMLElement,
-    LinkMLClass,
     LinkMLClassName,
     LinkMLSlotName,
-    LinkMLSchema,
-    LinkMLEnumeration,
+    CompiledElement,
+    CompiledClass,
+    CompiledEnum,
+    CompiledSchema,
+    CompiledType,
 )
+from linkml_asciidoc_generator.linkml.ranges import RangeKind
 
 from linkml_asciidoc_generator.asciidoc.standard_mapping import (
     CLASSES_IN_STANDARD,
@@ -27,6 +30,7 @@ from linkml_asciidoc_generator.config import Config
 
 
 LINKML_META_BASE_URI = "https://w3id.org/linkml/"
+GLOSSARY_URL = "https://begrippen.netbeheernederland.nl/begrippenkader.ttl"
 
 type ResourceName = str
 type CURIE = str
@@ -140,7 +144,7 @@ class Resource:
     name: ResourceName
 
 
-@dataclass
+@dataclass(frozen=True)
 class Element:
     name: LinkMLElementName
 
@@ -151,8 +155,15 @@ class Page(Resource):
     template: Jinja2TemplateFile
 
 
+@cache
+def _get_jinja2_environment(templates_dir: PathLike) -> jinja2.Environment:
+    # Shared per templates directory, so templates are only compiled once
+    # per process.
+    return jinja2.Environment(loader=jinja2.FileSystemLoader(templates_dir))
+
+
 def read_jinja2_template(template_path: RelativeFilePath, config: Config) -> Jinja2TemplateStr:
-    jinja2_env = jinja2.Environment(loader=jinja2.FileSystemLoader(config["templates"]["dir"]))
+    jinja2_env = _get_jinja2_environment(config["templates"]["dir"])
     template = jinja2_env.get_template(config["templates"][template_path])
 
     return template
@@ -181,9 +192,39 @@ def get_page_resource_id(name: ResourceName, kind: PageKind) -> ResourceID:
 # Render functions.
 
 
-def _xref_resource(name: ResourceName, kind: PageKind) -> AsciiDocStr:
+def is_pruned(name: ResourceName, config: Config | None) -> bool:
+    """Whether the element has no page in this build, because the build is
+    pruned and the element is out of reach of its seed classes."""
+
+    if config is None:
+        return False
+
+    elements = config.get("prune", {}).get("elements")
+
+    return elements is not None and name not in elements
+
+
+def _xref_external(
+    name: ResourceName, resource_id: ResourceID, config: Config
+) -> AsciiDocStr:
+    # The Antora module with the pages of the full schema, if there is one,
+    # as `component:module`.
+    external_module = config["prune"].get("external_module")
+
+    if external_module is None:
+        return f"`{name}`"
+
+    return f"xref:{external_module}:{resource_id}[`{name}`]"
+
+
+def _xref_resource(
+    name: ResourceName, kind: PageKind, config: Config | None = None
+) -> AsciiDocStr:
     resource_id = get_page_resource_id(name, kind)
 
+    if is_pruned(name, config):
+        return _xref_external(name, resource_id, config)
+
     return f"xref::{resource_id}[`{name}`]"
 
 
@@ -200,43 +241,52 @@ def link_curie(curie: CURIE, prefixes: PrefixesMap, label: str | None = None) ->
         return f"{base_uri}{ncname}[{label}]"
 
 
-def xref_class(class_name: ResourceName) -> AsciiDocStr:
-    return _xref_resource(class_name, PageKind.CLASS_PAGE)
+def xref_class(class_name: ResourceName, config: Config | None = None) -> AsciiDocStr:
+    return _xref_resource(class_name, PageKind.CLASS_PAGE, config)
 
 
-def xref_enum(enum_name: ResourceName) -> AsciiDocStr:
-    return _xref_resource(enum_name, PageKind.ENUMERATION_PAGE)
+def xref_enum(enum_name: ResourceName, config: Config | None = None) -> AsciiDocStr:
+    return _xref_resource(enum_name, PageKind.ENUMERATION_PAGE, config)
 
 
 def xref_slot(
     slot_name: ResourceName,
     owner_class: ResourceName | None = None,
+    config: Config | None = None,
 ) -> AsciiDocStr:
     if owner_class is not None:  # Slot section on class page.
-        return f"xref::class/{owner_class}.adoc#{slot_name}[`{slot_name}`]"
+        resource_id = f"class/{owner_class}.adoc#{slot_name}"
+        if is_pruned(owner_class, config):
+            return _xref_external(slot_name, resource_id, config)
+
+        return f"xref::{resource_id}[`{slot_name}`]"
     else:  # Slot page.
-        return _xref_resource(slot_name, PageKind.SLOT_PAGE)
+        return _xref_resource(slot_name, PageKind.SLOT_PAGE, config)
 
 
-def xref_type(type_name) -> AsciiDocStr:
-    # def xref_type(type_name: LinkMLPrimitive) -> AsciiDocStr:
+def xref_custom_type(type_name: ResourceName, config: Config | None = None) -> AsciiDocStr:
+    return _xref_resource(type_name, PageKind.TYPE_PAGE, config)
 
+
+def xref_type(
+    type_name: LinkMLPrimitive | ResourceName,
+    kind: RangeKind | None = None,
+    config: Config | None = None,
+) -> AsciiDocStr:
     if type_name in LinkMLPrimitive:
         uri_name = type_name.value[0].upper() + type_name.value[1:]
         uri = LINKML_META_BASE_URI + uri_name
 
         return f"{uri}[`{type_name.value}`]"
+    elif kind is RangeKind.TYPE:
+        return xref_custom_type(type_name, config)
     else:
-        # return _xref_resource(type_name, PageKind.TYPE_PAGE)  # TODO
+        # Classes are ranges of relations, which use `destination_class`
+        # instead of `data_type`, so without a kind the range is an enum.
+        return xref_enum(type_name, config)
 
-        # TODO: UGLY. Assume non-primitive data type is enum, since classes
-        # can only be ranges of relations which don't use the `data_type` field
-        # but `destination_class` field.
-        # This will fix that enum ranges are hyperlinks.
-        return xref_enum(type_name)
 
-
-def get_standard_for_class(class_: LinkMLClass) -> CIMStandard | None:
+def get_standard_for_class(class_: CompiledClass) -> CIMStandard | None:
     # TODO: This is a temporary semi-hardcoded solution.
 
     for standard, classes in CLASSES_IN_STANDARD.items():
@@ -245,7 +295,7 @@ def get_standard_for_class(class_: LinkMLClass) -> CIMStandard | None:
     return None
 
 
-def get_standard_for_enumeration(enum: LinkMLEnumeration) -> CIMStandard | None:
+def get_standard_for_enumeration(enum: CompiledEnum) -> CIMStandard | None:
     # TODO: This is a temporary semi-hardcoded solution.
 
     return CIMStandard.IEC61970  # TODO: Implement.
@@ -256,7 +306,7 @@ def get_standard_for_enumeration(enum: LinkMLEnumeration) -> CIMStandard | None:
     return None
 
 
-def get_skos_mappings(element: LinkMLElement) -> SkosMapping:
+def get_skos_mappings(element: CompiledElement) -> SkosMapping:
     mappings = {}
 
     if element.exact_mappings:
@@ -273,27 +323,35 @@ def get_skos_mappings(element: LinkMLElement) -> SkosMapping:
     return mappings
 
 
-def is_cim_data_type(class_: LinkMLClass):
+def is_cim_data_type(class_: CompiledClass):
     return class_.class_uri in CIM_DATA_TYPES
 
 
 def generate_used_by(
-    element: LinkMLClass | LinkMLEnumeration, schema: LinkMLSchema
+    element: CompiledClass | CompiledEnum | CompiledType, schema: CompiledSchema
 ) -> UsedByMap:
     used_by_classes = {}
 
-    if not schema.classes:
-        return used_by_classes
+    for class_name, slot in schema.index.get_used_by(element):
+        used_by_classes.setdefault(class_name, []).append(slot.name)
 
-    for source_class_name, source_class in schema.classes.items():
-        if source_class.attributes is None:
-            continue
+    return used_by_classes
 
-        for slot_name, slot in source_class.attributes.items():
-            if slot.range == element._meta["name"]:
-                used_by_classes.setdefault(source_class_name, []).append(slot_name)
 
-    return used_by_classes
+def generate_used_by_superclass(
+    class_: CompiledClass, schema: CompiledSchema
+) -> dict[LinkMLClassName, UsedByMap]:
+    """Uses of the class through slots with one of its superclasses as range,
+    by superclass, starting with the nearest."""
+
+    used_by_superclass = {}
+
+    for superclass in schema.index.get_ancestors(class_):
+        used_by = generate_used_by(superclass, schema)
+        if used_by:
+            used_by_superclass[superclass.name] = used_by
+
+    return used_by_superclass
 
 
 def resolve_curie(curie: CURIE, prefixes: PrefixesMap) -> URI:
@@ -304,13 +362,28 @@ def resolve_curie(curie: CURIE, prefixes: PrefixesMap) -> URI:
     return uri
 
 
-def label_for(curie: str, prefixes: PrefixesMap) -> str:
-    uri = resolve_curie(curie, prefixes)
-
+@cache
+def _get_glossary_labels(glossary_url: URI) -> dict[URIRef, str]:
     g = Graph()
-    g.parse("https://begrippen.netbeheernederland.nl/begrippenkader.ttl")
+    g.parse(glossary_url)
 
+    labels = {}
     for subj, pred, obj in g:
-        if subj == URIRef(uri) and pred == SKOS.prefLabel:
-            return obj
+        if pred == SKOS.prefLabel:
+            labels.setdefault(subj, obj)
+
+    return labels
+
+
+def load_glossary_labels() -> None:
+    """Fetches the glossary labels into the cache of this process, so that
+    processes forked from it after this do not each fetch them again."""
+
+    _get_glossary_labels(GLOSSARY_URL)
+
+
+def label_for(curie: str, prefixes: PrefixesMap) -> str:
+    uri = resolve_curie(curie, prefixes)
+
+    return _get_glossary_labels(GLOSSARY_URL).get(URIRef(uri))
 
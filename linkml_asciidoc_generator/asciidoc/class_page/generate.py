@@ -1,10 +1,11 @@
+from typing import Callable, Hashable
+from weakref import WeakKeyDictionary
+
 from linkml_asciidoc_generator.linkml.model import (
-    LinkMLClass,
-    LinkMLEnumeration,
-    LinkMLSlot,
-    LinkMLSlotOwner,
-    LinkMLSchema,
-    LinkMLPrimitive,
+    CompiledClass,
+    CompiledSlot,
+    CompiledSchema,
+    LinkMLClassName,
 )
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc.class_page.model import (
@@ -13,11 +14,13 @@ from linkml_asciidoc_generator.asciidoc.class_page.model import (
     Relation,
     Attribute,
     RelationsDiagram,
-    PositiveInt,
 )
 from linkml_asciidoc_generator.linkml.query import (
     get_ancestors,
     get_descendants,
+    get_mro,
+    get_subclass_tree,
+    get_neighbourhood_relations,
     get_relations,
     get_attributes,
 )
@@ -26,108 +29,197 @@ from linkml_asciidoc_generator.asciidoc import (
     get_standard_for_class,
     is_cim_data_type,
     generate_used_by,
+    generate_used_by_superclass,
+)
+
+
+# Models that are the same on every page they appear on, shared by all pages
+# of a schema: summaries of relation targets, and slots by owner. They are
+# frozen, so no page can change them for the others. Each schema has its own
+# models, kept for as long as the schema is, or until `drop_shared_models`.
+# Pages built in other processes share them only within that process.
+_shared_models: WeakKeyDictionary[CompiledSchema, dict[Hashable, object]] = (
+    WeakKeyDictionary()
 )
 
 
-def _get_min_cardinality(slot: LinkMLSlot) -> int:
-    match slot.required:
-        case False | None:
-            return 0
-        case True:
-            return 1
+def _get_shared_model[T](
+    schema: CompiledSchema, key: Hashable, create: Callable[[], T]
+) -> T:
+    models = _shared_models.get(schema)
+    if models is None:
+        models = _shared_models[schema] = {}
 
-    return int(slot.required)
+    model = models.get(key)
+    if model is None:
+        model = models[key] = create()
 
+    return model
 
-def _get_max_cardinality(slot: LinkMLSlot) -> PositiveInt | None:
-    match slot.multivalued:
-        case False | None:
-            return 1
-        case True:
-            return None
 
+def drop_shared_models(schema: CompiledSchema) -> None:
+    """Lets go of the models shared by the pages of the schema generated so
+    far. Pages generated after this create their own."""
 
-def _generate_data_type(slot_range) -> LinkMLPrimitive | LinkMLEnumeration:
-    # `None`
-    # TODO: `default_range` should be parsed, then this logic here would probably not be necessary.
-    if slot_range is None:
-        return LinkMLPrimitive.STRING
+    _shared_models.pop(schema, None)
 
-    # Primitive
-    for enum_val in dict(LinkMLPrimitive.__members__).values():
-        if enum_val.value == slot_range:
-            return enum_val
 
-    # Enumeration
-    return slot_range
+def _generate_attribute(
+    slot_owner: LinkMLClassName | None, slot: CompiledSlot, schema: CompiledSchema
+) -> Attribute:
+    return _get_shared_model(
+        schema,
+        (Attribute, slot_owner, slot),
+        lambda: _create_attribute(slot_owner, slot, schema),
+    )
 
 
-def _generate_attribute(slot_owner: LinkMLSlotOwner, slot: LinkMLSlot) -> Attribute:
+def _create_attribute(
+    slot_owner: LinkMLClassName | None, slot: CompiledSlot, schema: CompiledSchema
+) -> Attribute:
     return Attribute(
-        name=slot._meta["name"],
-        data_type=_generate_data_type(slot.range),
+        name=slot.name,
+        data_type=schema.slot_table.get_data_type(slot),
+        data_type_kind=schema.slot_table.get_data_type_kind(slot),
         inherited_from=slot_owner,
         description=slot.description,
         uri=slot.slot_uri,
-        min_cardinality=_get_min_cardinality(slot),
-        max_cardinality=_get_max_cardinality(slot),
+        min_cardinality=schema.slot_table.get_min_cardinality(slot),
+        max_cardinality=schema.slot_table.get_max_cardinality(slot),
         skos_mappings=get_skos_mappings(slot),
         see_also=slot.see_also,
     )
 
 
+def _generate_class_reference(
+    class_: CompiledClass, schema: CompiledSchema
+) -> Class:
+    """The class as far as needed to refer to it, without its slots."""
+
+    return _get_shared_model(
+        schema, (Class, class_), lambda: _create_class_reference(class_, schema)
+    )
+
+
+def _create_class_reference(class_: CompiledClass, schema: CompiledSchema) -> Class:
+    return Class(
+        name=class_.name,
+        is_abstract=bool(class_.abstract),
+        is_mixin=bool(class_.mixin),
+        is_cim_data_type=is_cim_data_type(class_),
+        description=class_.description,
+        uri=class_.class_uri,
+        ancestors=(),
+        resolution_order=(),
+        descendants=(),
+        attributes=(),
+        relations=(),  # No need for these, and can cause recursion errors such as with `Terminal.topologicalNodes <-> TopologicalNode.terminal``
+        prefixes=schema.prefixes,
+        standard=get_standard_for_class(class_),
+    )
+
+
 def _generate_relation(
-    slot_owner: LinkMLSlotOwner, slot: LinkMLSlot, schema: LinkMLSchema, config: Config
+    slot_owner: LinkMLClassName | None,
+    slot: CompiledSlot,
+    schema: CompiledSchema,
+    config: Config,
+) -> Relation:
+    return _get_shared_model(
+        schema,
+        (Relation, slot_owner, slot),
+        lambda: _create_relation(slot_owner, slot, schema),
+    )
+
+
+def _create_relation(
+    slot_owner: LinkMLClassName | None, slot: CompiledSlot, schema: CompiledSchema
 ) -> Relation:
-    target_class = schema.classes[slot.range]
     return Relation(
-        name=slot._meta["name"],
-        destination_class=Class(
-            name=target_class._meta["name"],
-            is_abstract=bool(target_class.abstract),
-            is_mixin=bool(target_class.mixin),
-            is_cim_data_type=is_cim_data_type(target_class),
-            description=target_class.description,
-            uri=target_class.class_uri,
-            ancestors=[],
-            descendants=[],
-            attributes=[],
-            relations=[],  # No need for these, and can cause recursion errors such as with `Terminal.topologicalNodes <-> TopologicalNode.terminal``
-            prefixes=schema.prefixes,
-            standard=get_standard_for_class(target_class),
-        ),
+        name=slot.name,
+        destination_class=_generate_class_reference(slot.range_element, schema),
         inherited_from=slot_owner,
         description=slot.description,
         uri=slot.slot_uri,
-        min_cardinality=_get_min_cardinality(slot),
-        max_cardinality=_get_max_cardinality(slot),
+        min_cardinality=schema.slot_table.get_min_cardinality(slot),
+        max_cardinality=schema.slot_table.get_max_cardinality(slot),
         skos_mappings=get_skos_mappings(slot),
         see_also=slot.see_also,
     )
 
 
-def generate_class(class_: LinkMLClass, schema: LinkMLSchema, config: Config) -> Class:
+def _generate_relations_diagram(
+    class_: CompiledClass, _class_: Class, schema: CompiledSchema, config: Config
+) -> RelationsDiagram:
+    hops = config["diagrams"].get("relation_hops", 1)
+    diagram = RelationsDiagram(
+        name=f"{_class_.name}_relations",
+        template=config["templates"]["class_page_relations_diagram"],
+        class_=_class_,
+    )
+    if hops <= 1:
+        return diagram
+
+    # The direct relations are on the class itself; add the ones further out,
+    # leaving out CIM data types like the direct relations do.
+    shown = {class_.name} | {r.destination_class.name for r in _class_.relations}
+    shown_relations = set()
+    for source, slot_name, target in get_neighbourhood_relations(class_, schema, hops):
+        if source == class_.name:
+            continue
+
+        source_class, target_class = schema.classes[source], schema.classes[target]
+        if is_cim_data_type(source_class) or is_cim_data_type(target_class):
+            continue
+
+        edge = (source, slot_name, target)
+        if edge not in shown_relations:
+            shown_relations.add(edge)
+            diagram.neighbour_relations.append(edge)
+        for neighbour in (source_class, target_class):
+            if neighbour.name not in shown:
+                shown.add(neighbour.name)
+                diagram.neighbours.append(_generate_class_reference(neighbour, schema))
+
+    return diagram
+
+
+def generate_class(
+    class_: CompiledClass, schema: CompiledSchema, config: Config
+) -> Class:
     _class_ = Class(
-        name=class_._meta["name"],
+        name=class_.name,
         is_abstract=bool(class_.abstract),
         is_mixin=bool(class_.mixin),
         is_root=bool(class_.tree_root),
         is_cim_data_type=is_cim_data_type(class_),
         description=class_.description,
         uri=class_.class_uri,
-        ancestors=[c._meta["name"] for c in get_ancestors(class_, schema)],
-        descendants=[c._meta["name"] for c in get_descendants(class_, schema)],
+        ancestors=tuple(c.name for c in get_ancestors(class_, schema)),
+        resolution_order=tuple(c.name for c in get_mro(class_, schema)),
+        descendants=tuple(c.name for c in get_descendants(class_, schema)),
+        subclass_tree=tuple(
+            (c.name, depth)
+            for c, depth in get_subclass_tree(
+                class_, schema, config.get("class_hierarchy", {}).get("depth", 1) or None
+            )
+        ),
         used_by=generate_used_by(class_, schema),
-        attributes=[
-            _generate_attribute(a[0] if a[0] != class_._meta["name"] else None, a[1])
+        used_by_superclass=(
+            generate_used_by_superclass(class_, schema)
+            if config.get("used_by", {}).get("polymorphic", False)
+            else None
+        ),
+        attributes=tuple(
+            _generate_attribute(a[0] if a[0] != class_.name else None, a[1], schema)
             for a in get_attributes(class_, schema)
-        ],
-        relations=[
+        ),
+        relations=tuple(
             _generate_relation(
-                r[0] if r[0] != class_._meta["name"] else None, r[1], schema, config
+                r[0] if r[0] != class_.name else None, r[1], schema, config
             )
             for r in get_relations(class_, schema)
-        ],
+        ),
         prefixes=schema.prefixes,
         standard=get_standard_for_class(class_),
         skos_mappings=get_skos_mappings(class_),
@@ -138,16 +230,12 @@ def generate_class(class_: LinkMLClass, schema: LinkMLSchema, config: Config) ->
 
 
 def generate_class_page(
-    class_: LinkMLClass, schema: LinkMLSchema, config: Config
+    class_: CompiledClass, schema: CompiledSchema, config: Config
 ) -> ClassPage:
     _class_ = generate_class(class_, schema, config)
 
     if config["diagrams"]["relations"]:
-        relations_diagram = RelationsDiagram(
-            name=f"{_class_.name}_relations",
-            template=config["templates"]["class_page_relations_diagram"],
-            class_=_class_,
-        )
+        relations_diagram = _generate_relations_diagram(class_, _class_, schema, config)
     else:
         relations_diagram = None
 
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from linkml_asciidoc_generator.asciidoc import (
     Resource,
     Jinja2TemplateFile,
@@ -16,16 +16,18 @@ from linkml_asciidoc_generator.linkml.model import (
     LinkMLPrimitive,
     LinkMLElementName,
 )
+from linkml_asciidoc_generator.linkml.ranges import RangeKind
+from linkml_asciidoc_generator.linkml.relation_graph import RelationEdge
 
 type PositiveInt = int
 
 
-@dataclass
+@dataclass(frozen=True)
 class Slot(Element):
     pass
 
 
-@dataclass
+@dataclass(frozen=True)
 class Relation(Slot):
     destination_class: "Class"
     inherited_from: LinkMLClassName | None = None
@@ -34,30 +36,35 @@ class Relation(Slot):
     min_cardinality: int = 0
     max_cardinality: PositiveInt | None = None
     skos_mappings: SkosMapping | None = None
-    see_also: list[URI] | None = None
+    see_also: tuple[URI, ...] | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Attribute(Slot):
     data_type: LinkMLPrimitive | LinkMLClassName
+    data_type_kind: RangeKind | None = None
     inherited_from: LinkMLClassName | None = None
     description: str | None = None
     uri: CURIE | None = None
     min_cardinality: int = 0
     max_cardinality: PositiveInt | None = None
     skos_mappings: SkosMapping | None = None
-    see_also: list[URI] | None = None
+    see_also: tuple[URI, ...] | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class Class:
     name: LinkMLElementName
-    descendants: list[LinkMLClassName]
-    ancestors: list[LinkMLClassName]
-    relations: list[Relation]
-    attributes: list[Attribute]
+    descendants: tuple[LinkMLClassName, ...]
+    ancestors: tuple[LinkMLClassName, ...]
+    resolution_order: tuple[LinkMLClassName, ...]
+    relations: tuple[Relation, ...]
+    attributes: tuple[Attribute, ...]
     prefixes: PrefixesMap
     used_by: UsedByMap | None = None
+    used_by_superclass: dict[LinkMLClassName, UsedByMap] | None = None
+    # Descendants down to the configured depth, as shown in the hierarchy.
+    subclass_tree: tuple[tuple[LinkMLClassName, PositiveInt], ...] = ()
     uri: CURIE | None = None
     is_abstract: bool = False
     is_mixin: bool = False
@@ -66,7 +73,7 @@ class Class:
     standard: CIMStandard | None = None
     description: str | None = None
     skos_mappings: SkosMapping | None = None
-    see_also: list[URI] | None = None
+    see_also: tuple[URI, ...] | None = None
 
 
 @dataclass
@@ -77,6 +84,9 @@ class D2Diagram(Resource):
 @dataclass
 class RelationsDiagram(D2Diagram):
     class_: Class
+    # Classes and relations beyond the direct relations of the class.
+    neighbours: list[Class] = field(default_factory=list)
+    neighbour_relations: list[RelationEdge] = field(default_factory=list)
 
 
 @dataclass
@@ -29,10 +29,12 @@ from linkml_asciidoc_generator.asciidoc.class_page.model import (
 DEFAULT_COLOR = "#cccccc"
 
 
-def _render_class_hierarchy(class_: Class) -> AsciiDocStr:
+def _render_class_hierarchy(class_: Class, config: Config) -> AsciiDocStr:
+    xref = partial(xref_class, config=config)
+
     # Ancestors.
     hierarchy_adoc = reduce(
-        lambda acc, succ: f"{acc}{'*' * succ[0]} {xref_class(succ[1])}\n",
+        lambda acc, succ: f"{acc}{'*' * succ[0]} {xref(succ[1])}\n",
         enumerate(class_.ancestors[::-1], 1),
         "",
     )
@@ -41,13 +43,18 @@ def _render_class_hierarchy(class_: Class) -> AsciiDocStr:
     depth_self = len(class_.ancestors) + 1
     hierarchy_adoc += f"{'*' * depth_self} *`{class_.name}`*\n"
 
-    # Descendants.
+    # Descendants, as deep as they were generated.
     hierarchy_adoc += reduce(
-        lambda acc, succ: f"{acc} {'*' * (depth_self + 1)} {xref_class(succ)}\n",
-        sorted(class_.descendants),
+        lambda acc, succ: f"{acc} {'*' * (depth_self + succ[1])} {xref(succ[0])}\n",
+        class_.subclass_tree,
         "",
     )
 
+    # Mixins, and what they inherit, in method resolution order.
+    mixins = [c for c in class_.resolution_order if c not in class_.ancestors]
+    if mixins:
+        hierarchy_adoc += f"\nMixins: {', '.join(map(xref, mixins))}\n"
+
     return hierarchy_adoc
 
 
@@ -71,6 +78,8 @@ def _render_relations_diagram(
     template = read_jinja2_template("class_page_relations_diagram", config)
     content = template.render(
         class_=diagram.class_,
+        neighbours=diagram.neighbours,
+        neighbour_relations=diagram.neighbour_relations,
         color_class=partial(_get_class_color, config=config),
     )
 
@@ -86,9 +95,9 @@ def _get_class_color(class_: Class, config: Config) -> HexColor:
     return color
 
 
-def _get_sorted_slots_for_table(class_: Class, slots: list[Slot]) -> list[Slot]:
+def _get_sorted_slots_for_table(class_: Class, slots: tuple[Slot, ...]) -> list[Slot]:
     slots_for_table = []
-    for class_name in [None] + class_.ancestors:
+    for class_name in (None, *class_.resolution_order):
         slots_for_table += sorted(
             [s for s in slots if s.inherited_from == class_name], key=attrgetter("name")
         )
@@ -112,13 +121,13 @@ def _render_class_page(class_page: ClassPage, config: Config) -> AsciiDocStr:
             class_page.class_,
             class_page.class_.attributes + class_page.class_.relations,
         ),
-        class_hierarchy=_render_class_hierarchy(class_page.class_),
+        class_hierarchy=_render_class_hierarchy(class_page.class_, config),
         link_curie=partial(link_curie, prefixes=class_page.class_.prefixes),
         label_for=partial(label_for, prefixes=class_page.class_.prefixes),
-        xref_class=xref_class,
-        xref_enum=xref_enum,
-        xref_slot=xref_slot,
-        xref_type=xref_type,
+        xref_class=partial(xref_class, config=config),
+        xref_enum=partial(xref_enum, config=config),
+        xref_slot=partial(xref_slot, config=config),
+        xref_type=partial(xref_type, config=config),
         cardinalities=_render_cardinalities,
         relations_diagram=relations_diagram,
     )
@@ -126,7 +135,7 @@ def _render_class_page(class_page: ClassPage, config: Config) -> AsciiDocStr:
     return content
 
 
-def _get_sorted_slots_for_table_cim_data_type(slots: list[Slot]) -> list[Slot]:
+def _get_sorted_slots_for_table_cim_data_type(slots: tuple[Slot, ...]) -> list[Slot]:
     def _sort_slots_table(s):
         return {"value": 0, "multiplier": 1, "unit": 2}[s.name]
 
@@ -148,10 +157,10 @@ def _render_cim_data_type_page(class_page: ClassPage, config: Config) -> AsciiDo
         ),
         link_curie=partial(link_curie, prefixes=class_page.class_.prefixes),
         label_for=partial(label_for, prefixes=class_page.class_.prefixes),
-        xref_class=xref_class,
-        xref_enum=xref_enum,
-        xref_slot=xref_slot,
-        xref_type=xref_type,
+        xref_class=partial(xref_class, config=config),
+        xref_enum=partial(xref_enum, config=config),
+        xref_slot=partial(xref_slot, config=config),
+        xref_type=partial(xref_type, config=config),
         cardinalities=_render_cardinalities,
     )
 
@@ -1,7 +1,7 @@
 from linkml_asciidoc_generator.linkml.model import (
-    LinkMLEnumeration,
-    LinkMLEnumerationValue,
-    LinkMLSchema,
+    CompiledEnum,
+    CompiledPermissibleValue,
+    CompiledSchema,
 )
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc.enumeration_page.model import (
@@ -16,28 +16,20 @@ from linkml_asciidoc_generator.asciidoc import (
 )
 
 
-def _generate_enumeration_value(
-    enum: LinkMLEnumeration, pv_name: str
-) -> EnumerationValue:
-    pv: LinkMLEnumerationValue = enum.permissible_values[pv_name]
+def _generate_enumeration_value(pv: CompiledPermissibleValue) -> EnumerationValue:
     enumeration_value = EnumerationValue(description=pv.description,
-                                         value=pv_name, uri=pv.meaning)
+                                         value=pv.text, uri=pv.meaning)
 
     return enumeration_value
 
 
-def generate_enumeration(enum: LinkMLEnumeration, schema: LinkMLSchema) -> Enumeration:
+def generate_enumeration(enum: CompiledEnum, schema: CompiledSchema) -> Enumeration:
     enumeration = Enumeration(
-        name=enum._meta["name"],
+        name=enum.name,
         description=enum.description,
         uri=enum.enum_uri,
         used_by=generate_used_by(enum, schema),
-        values=[
-            _generate_enumeration_value(enum, pv_name)
-            for pv_name in (
-                enum.permissible_values or []
-            )  # TODO: This should be taken care of more thoroughly in the data model.
-        ],
+        values=[_generate_enumeration_value(pv) for pv in enum.permissible_values],
         prefixes=schema.prefixes,
         standard=get_standard_for_enumeration(enum),
         skos_mappings=get_skos_mappings(enum),
@@ -48,7 +40,7 @@ def generate_enumeration(enum: LinkMLEnumeration, schema: LinkMLSchema) -> Enume
 
 
 def generate_enumeration_page(
-    enum: LinkMLEnumeration, schema: LinkMLSchema, config: Config
+    enum: CompiledEnum, schema: CompiledSchema, config: Config
 ) -> EnumerationPage:
     enumeration = generate_enumeration(enum, schema)
 
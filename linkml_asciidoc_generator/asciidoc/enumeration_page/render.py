@@ -4,6 +4,7 @@ from linkml_asciidoc_generator.asciidoc import (
     AsciiDocStr,
     Jinja2TemplateStr,
     read_jinja2_template,
+    label_for,
     link_curie,
     xref_class,
     xref_slot,
@@ -22,8 +23,9 @@ def render_enumeration_page(
     content = template.render(
         enumeration=enumeration_page.enumeration,
         link_curie=partial(link_curie, prefixes=enumeration_page.enumeration.prefixes),
-        xref_class=xref_class,
-        xref_slot=xref_slot,
+        label_for=partial(label_for, prefixes=enumeration_page.enumeration.prefixes),
+        xref_class=partial(xref_class, config=config),
+        xref_slot=partial(xref_slot, config=config),
     )
 
     return content
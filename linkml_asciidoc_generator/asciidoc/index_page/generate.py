@@ -1,38 +1,44 @@
-from linkml_asciidoc_generator.linkml.model import LinkMLClass, LinkMLEnumeration
-from linkml_asciidoc_generator.linkml.model import LinkMLSchema
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledClass,
+    CompiledEnum,
+    CompiledType,
+)
+from linkml_asciidoc_generator.linkml.model import CompiledSchema
 from linkml_asciidoc_generator.config import Config
-from linkml_asciidoc_generator.asciidoc import is_cim_data_type
+from linkml_asciidoc_generator.asciidoc import is_cim_data_type, is_pruned
 from linkml_asciidoc_generator.asciidoc.index_page.model import (
     IndexPage,
     Class,
     CIMDataType,
     Enumeration,
+    Type,
 )
 
 
-def _generate_class(class_: LinkMLClass) -> Class:
-    return Class(name=class_._meta["name"], description=class_.description)
+def _generate_class(class_: CompiledClass) -> Class:
+    return Class(name=class_.name, description=class_.description)
+
 
+def _generate_cim_data_type(class_: CompiledClass) -> CIMDataType:
+    return Class(name=class_.name, description=class_.description)
 
-def _generate_cim_data_type(class_: LinkMLClass) -> CIMDataType:
-    return Class(name=class_._meta["name"], description=class_.description)
 
+def _generate_enum(enum: CompiledEnum) -> Enumeration:
+    return Enumeration(name=enum.name, description=enum.description)
 
-def _generate_enum(enum: LinkMLEnumeration) -> Enumeration:
-    return Enumeration(name=enum._meta["name"], description=enum.description)
 
+def _generate_type(type_: CompiledType) -> Type:
+    return Type(name=type_.name, description=type_.description)
 
-def generate_index_page(schema: LinkMLSchema, config: Config) -> IndexPage:
-    # TODO: Hacky, but works.
-    if schema.classes is None:
-        linkml_classes = []
-    else:
-        linkml_classes = list(schema.classes.values())
 
-    if schema.enums is None:
-        linkml_enums = []
-    else:
-        linkml_enums = list(schema.enums.values())
+def generate_index_page(schema: CompiledSchema, config: Config) -> IndexPage:
+    linkml_classes = [
+        c for c in schema.classes.values() if not is_pruned(c.name, config)
+    ]
+    linkml_enums = [e for e in schema.enums.values() if not is_pruned(e.name, config)]
+    linkml_types = [
+        t for t in schema.ranges.get_custom_types() if not is_pruned(t.name, config)
+    ]
 
     classes = [
         _generate_class(c)
@@ -42,6 +48,7 @@ def generate_index_page(schema: LinkMLSchema, config: Config) -> IndexPage:
         _generate_cim_data_type(c) for c in filter(is_cim_data_type, linkml_classes)
     ]
     enumerations = [_generate_enum(e) for e in linkml_enums]
+    types = [_generate_type(t) for t in linkml_types]
 
     index_page = IndexPage(
         name="index",
@@ -50,6 +57,7 @@ def generate_index_page(schema: LinkMLSchema, config: Config) -> IndexPage:
         classes=classes,
         cim_data_types=cim_data_types,
         enumerations=enumerations,
+        types=types,
     )
 
     return index_page
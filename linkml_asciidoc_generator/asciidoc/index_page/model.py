@@ -20,8 +20,15 @@ class CIMDataType:
     description: str | None = None
 
 
+@dataclass
+class Type:
+    name: str
+    description: str | None = None
+
+
 @dataclass
 class IndexPage(Page):
     classes: list[Class]
     cim_data_types: list[CIMDataType]
     enumerations: list[Enumeration]
+    types: list[Type]
@@ -1,9 +1,12 @@
+from functools import partial
+
 from linkml_asciidoc_generator.asciidoc import (
     AsciiDocStr,
     Jinja2TemplateStr,
     read_jinja2_template,
     xref_class,
     xref_enum,
+    xref_custom_type,
 )
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc.index_page.model import (
@@ -14,7 +17,10 @@ from linkml_asciidoc_generator.asciidoc.index_page.model import (
 def render_index_page(index_page: IndexPage, config: Config) -> AsciiDocStr:
     template: Jinja2TemplateStr = read_jinja2_template("index_page", config)
     content = template.render(
-        page=index_page, xref_class=xref_class, xref_enum=xref_enum
+        page=index_page,
+        xref_class=partial(xref_class, config=config),
+        xref_enum=partial(xref_enum, config=config),
+        xref_custom_type=partial(xref_custom_type, config=config),
     )
 
     return content
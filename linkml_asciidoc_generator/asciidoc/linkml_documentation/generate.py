@@ -1,5 +1,16 @@
-from linkml_asciidoc_generator.linkml.model import LinkMLSchema
+from collections.abc import Iterator
+
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledSchema,
+    LinkMLElementName,
+)
 from linkml_asciidoc_generator.config import Config
+from linkml_asciidoc_generator.asciidoc import (
+    Page,
+    PageKind,
+    ResourceName,
+    is_pruned,
+)
 from linkml_asciidoc_generator.asciidoc.linkml_documentation.model import (
     LinkMLDocumentation,
 )
@@ -7,47 +18,166 @@ from linkml_asciidoc_generator.asciidoc.class_page.generate import generate_clas
 from linkml_asciidoc_generator.asciidoc.enumeration_page.generate import (
     generate_enumeration_page,
 )
+from linkml_asciidoc_generator.asciidoc.type_page.generate import generate_type_page
 from linkml_asciidoc_generator.asciidoc.index_page.generate import generate_index_page
 from linkml_asciidoc_generator.asciidoc.navigation_page.generate import (
     generate_navigation_page,
 )
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.parallel import (
+    get_process_pool,
+    split_into_chunks,
+)
+
+
+# The schema and config of a worker process, set when the worker starts.
+_worker_schema: CompiledSchema | None = None
+_worker_config: Config | None = None
+
+
+def _init_worker(schema: CompiledSchema, config: Config) -> None:
+    global _worker_schema, _worker_config
+
+    _worker_schema = schema
+    _worker_config = config
+
+
+def _generate_pages_in_worker(
+    kind: PageKind, names: list[LinkMLElementName]
+) -> list[Page]:
+    return [generate_page(kind, n, _worker_schema, _worker_config) for n in names]
+
+
+def _generate_pages_in_parallel(
+    schema: CompiledSchema,
+    config: Config,
+    names: dict[PageKind, list[LinkMLElementName]],
+    jobs: int,
+) -> dict[PageKind, dict[ResourceName, Page]]:
+    """Generates the pages of the named elements in a pool of `jobs`
+    processes.
+
+    Each worker gets the schema once, when it starts. The names are split
+    into consecutive chunks, and the pages are put back together in the
+    order of the names, as a serial run would.
+    """
+
+    tasks = [
+        (kind, chunk)
+        for kind, kind_names in names.items()
+        for chunk in split_into_chunks(kind_names, jobs)
+    ]
+
+    pages = {kind: {} for kind in names}
+    with get_process_pool(jobs, _init_worker, (schema, config)) as executor:
+        futures = [
+            (kind, chunk, executor.submit(_generate_pages_in_worker, kind, chunk))
+            for kind, chunk in tasks
+        ]
+        for kind, chunk, future in futures:
+            pages[kind].update(zip(chunk, future.result()))
+
+    return pages
+
+
+def _get_page_names(
+    schema: CompiledSchema, config: Config
+) -> dict[PageKind, list[LinkMLElementName]]:
+    """Names of the classes, enums and custom types to generate pages for,
+    in the order they are written."""
+
+    only = config.get("only")
+
+    def _has_page(name: LinkMLElementName) -> bool:
+        return (not only or name in only) and not is_pruned(name, config)
+
+    return {
+        PageKind.CLASS_PAGE: [c.name for c in schema.classes.values() if _has_page(c.name)],
+        PageKind.ENUMERATION_PAGE: [
+            e.name for e in schema.enums.values() if _has_page(e.name)
+        ],
+        # Primitives link to the LinkML documentation instead.
+        PageKind.TYPE_PAGE: [
+            t.name for t in schema.ranges.get_custom_types() if _has_page(t.name)
+        ],
+    }
+
+
+def generate_page(
+    kind: PageKind, name: LinkMLElementName, schema: CompiledSchema, config: Config
+) -> Page:
+    """Generates the page of the class, enum or custom type."""
+
+    match kind:
+        case PageKind.CLASS_PAGE:
+            return generate_class_page(schema.classes[name], schema, config)
+        case PageKind.ENUMERATION_PAGE:
+            return generate_enumeration_page(schema.enums[name], schema, config)
+        case PageKind.TYPE_PAGE:
+            return generate_type_page(schema.types[name], schema, config)
+
+
+def generate_pages(
+    schema: CompiledSchema, config: Config
+) -> Iterator[tuple[PageKind, ResourceName, Page]]:
+    """Generates the pages of the schema one at a time, as they are asked
+    for, in the order they are written.
+
+    Unlike `generate_linkml_documentation`, this does not keep the pages, so
+    a page can be rendered and written before the next one is generated.
+    """
+
+    if not config.get("only"):
+        yield PageKind.INDEX_PAGE, "index", generate_index_page(schema, config)
+        yield PageKind.NAVIGATION_PAGE, "nav", generate_navigation_page(schema, config)
+
+    for kind, names in _get_page_names(schema, config).items():
+        for name in names:
+            yield kind, name, generate_page(kind, name, schema, config)
 
 
 def generate_linkml_documentation(
-    schema: LinkMLSchema, config: Config
+    schema: CompiledSchema, config: Config
 ) -> LinkMLDocumentation:
-    index_page = generate_index_page(schema, config)
-    navigation_page = generate_navigation_page(schema, config)
-
-    # Classes.
-    class_pages = {
-        c._meta["name"]: generate_class_page(c, schema, config)
-        for c in schema.classes.values()
-        if c._meta["name"]
-        # in [
-        #     "MarketEvaluationPoint",
-        #     "UsagePoint",
-        #     "Substation",
-        #     "ActivePower",
-        #     "IdentifiedObject",
-        # ]
-    }
+    """Generates the pages of the schema.
 
-    # Slots.
-    slot_pages = {}
+    With `config["only"]`, only the pages of those classes and enums are
+    generated, and the index and navigation pages are left out. A pruned
+    config (see `get_pruned_config`) leaves out the pages of the elements
+    out of reach of its seed classes. With
+    `config["jobs"]` above 1, class and enumeration pages are generated in
+    that many processes, with the same result.
+    """
+
+    only = config.get("only")
+    jobs = config.get("jobs", 1)
+
+    if only:
+        index_page = None
+        navigation_page = None
+    else:
+        index_page = generate_index_page(schema, config)
+        navigation_page = generate_navigation_page(schema, config)
+
+    names = _get_page_names(schema, config)
+    type_names = names.pop(PageKind.TYPE_PAGE)
 
-    # Enumerations.
-    # TODO: Hacky, but works.
-    if schema.enums is None:
-        linkml_enums = {}
+    if jobs > 1:
+        pages = _generate_pages_in_parallel(schema, config, names, jobs)
     else:
-        linkml_enums = schema.enums
+        pages = {
+            kind: {name: generate_page(kind, name, schema, config) for name in kind_names}
+            for kind, kind_names in names.items()
+        }
+    class_pages = pages[PageKind.CLASS_PAGE]
+    enumeration_pages = pages[PageKind.ENUMERATION_PAGE]
+
+    # Slots.
+    slot_pages = {}
 
-    enumeration_pages = {
-        e._meta["name"]: generate_enumeration_page(e, schema, config)
-        for e in linkml_enums.values()
+    type_pages = {
+        name: generate_page(PageKind.TYPE_PAGE, name, schema, config)
+        for name in type_names
     }
-    type_pages = {}  # TODO.
 
     linkml_documentation = LinkMLDocumentation(
         name=schema.name,
@@ -11,8 +11,8 @@ from linkml_asciidoc_generator.asciidoc.type_page.model import TypePage
 class LinkMLDocumentation:
     name: str
     title: str
-    index_page: Page
-    navigation_page: Page
+    index_page: Page | None
+    navigation_page: Page | None
     class_pages: dict[ResourceName, ClassPage]
     slot_pages: dict[ResourceName, SlotPage]
     enumeration_pages: dict[ResourceName, EnumerationPage]
@@ -22,8 +22,8 @@ class LinkMLDocumentation:
 @dataclass
 class RenderedLinkMLDocumentation:
     name: str
-    index_page: AsciiDocStr
-    navigation_page: AsciiDocStr
+    index_page: AsciiDocStr | None
+    navigation_page: AsciiDocStr | None
     class_pages: dict[ResourceName, AsciiDocStr]
     slot_pages: dict[ResourceName, AsciiDocStr]
     enumeration_pages: dict[ResourceName, AsciiDocStr]
@@ -0,0 +1,40 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Sequence
+
+
+# Tasks per worker: enough to even out pages of different sizes, few enough
+# that sending them and their results back costs little.
+CHUNKS_PER_WORKER = 4
+
+
+def get_process_pool(
+    jobs: int, initializer: Callable[..., None], initargs: tuple[Any, ...]
+) -> ProcessPoolExecutor:
+    """A pool of `jobs` worker processes, each set up with `initializer`.
+
+    Workers are forked where the platform allows it, so they share the
+    arguments they are set up with, such as the compiled schema, with this
+    process instead of receiving a pickled copy.
+    """
+
+    if "fork" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("fork")
+    else:
+        mp_context = None
+
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=mp_context,
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+def split_into_chunks[T](items: Sequence[T], jobs: int) -> list[Sequence[T]]:
+    """Splits the items into consecutive chunks, so that results of the
+    chunks can be joined in order."""
+
+    chunk_size = max(1, -(-len(items) // (jobs * CHUNKS_PER_WORKER)))
+
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
@@ -0,0 +1,47 @@
+from linkml_asciidoc_generator.linkml.model import CompiledClass, CompiledSchema
+from linkml_asciidoc_generator.linkml.query import get_reachable_elements
+from linkml_asciidoc_generator.config import Config
+
+
+def _get_seed_classes(schema: CompiledSchema, config: Config) -> list[CompiledClass]:
+    """The seed classes named in the config, or else the `tree_root`
+    classes of the schema."""
+
+    seeds = config["prune"].get("seeds")
+
+    if seeds:
+        unknown = sorted(name for name in seeds if name not in schema.classes)
+        if unknown:
+            raise ValueError(
+                f"Seed classes not in schema {schema.name!r}: {', '.join(unknown)}"
+            )
+
+        return [schema.classes[name] for name in sorted(seeds)]
+
+    roots = [c for c in schema.classes.values() if c.tree_root]
+    if not roots:
+        raise ValueError(
+            f"Schema {schema.name!r} has no tree_root class to prune from;"
+            " name seed classes instead"
+        )
+
+    return roots
+
+
+def get_pruned_config(schema: CompiledSchema, config: Config) -> Config:
+    """The config for a build of only the pages of the classes reachable
+    from the seed classes, and of the enums and custom types they use.
+
+    Without pruning in the config, that is the config itself. Otherwise,
+    the names of the elements that get a page are added to it; all other
+    elements are referred to as external.
+    """
+
+    prune = config.get("prune", {})
+
+    if not prune.get("enabled") or prune.get("elements") is not None:
+        return config
+
+    elements = get_reachable_elements(_get_seed_classes(schema, config), schema)
+
+    return config | {"prune": prune | {"elements": elements}}
@@ -1,4 +1,12 @@
 from linkml_asciidoc_generator.config import Config
+from linkml_asciidoc_generator.asciidoc import (
+    AsciiDocStr,
+    Page,
+    PageKind,
+    ResourceName,
+    load_glossary_labels,
+    read_jinja2_template,
+)
 from linkml_asciidoc_generator.asciidoc.linkml_documentation.model import (
     LinkMLDocumentation,
     RenderedLinkMLDocumentation,
@@ -15,30 +23,164 @@ from linkml_asciidoc_generator.asciidoc.enumeration_page.render import (
     render_enumeration_page,
 )
 from linkml_asciidoc_generator.asciidoc.type_page.render import render_type_page
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.parallel import (
+    get_process_pool,
+    split_into_chunks,
+)
+
+
+PAGE_RENDERERS = {
+    PageKind.INDEX_PAGE: render_index_page,
+    PageKind.NAVIGATION_PAGE: render_navigation_page,
+    PageKind.CLASS_PAGE: render_class_page,
+    PageKind.SLOT_PAGE: render_slot_page,
+    PageKind.ENUMERATION_PAGE: render_enumeration_page,
+    PageKind.TYPE_PAGE: render_type_page,
+}
+
+# Templates of the pages rendered in parallel, compiled once per worker.
+PARALLEL_TEMPLATES = (
+    "class_page",
+    "cim_data_type_page",
+    "class_page_relations_diagram",
+    "enumeration_page",
+)
+
+# The config of a worker process, set when the worker starts.
+_worker_config: Config | None = None
+
+
+def _init_worker(config: Config) -> None:
+    global _worker_config
+
+    _worker_config = config
+
+    for template_name in PARALLEL_TEMPLATES:
+        read_jinja2_template(template_name, config)
+
+
+def render_page(kind: PageKind, page: Page, config: Config) -> AsciiDocStr:
+    return PAGE_RENDERERS[kind](page, config)
+
+
+def _render_pages_in_worker(kind: PageKind, pages: list[Page]) -> list[AsciiDocStr]:
+    return [render_page(kind, page, _worker_config) for page in pages]
+
+
+def _uses_glossary(kind: PageKind, page: Page) -> bool:
+    """Whether rendering the page looks up labels in the glossary, which it
+    does for every term of the SKOS mappings it shows."""
+
+    match kind:
+        case PageKind.CLASS_PAGE if not page.class_.is_cim_data_type:
+            class_ = page.class_
+            mappings = [
+                class_.skos_mappings,
+                *(slot.skos_mappings for slot in class_.attributes + class_.relations),
+            ]
+        case PageKind.ENUMERATION_PAGE:
+            mappings = [page.enumeration.skos_mappings]
+        case PageKind.TYPE_PAGE:
+            mappings = [page.type_.skos_mappings]
+        case _:
+            return False
+
+    return any(terms for mapping in mappings if mapping for terms in mapping.values())
+
+
+def _render_pages_in_parallel(
+    pages: dict[PageKind, dict[ResourceName, Page]], config: Config, jobs: int
+) -> dict[PageKind, dict[ResourceName, AsciiDocStr]]:
+    """Renders the pages in a pool of `jobs` processes.
+
+    Pages are sent to the workers in batches of consecutive pages, and the
+    rendered pages are put back together in their original order.
+    """
+
+    tasks = [
+        (kind, chunk)
+        for kind, kind_pages in pages.items()
+        for chunk in split_into_chunks(list(kind_pages.items()), jobs)
+    ]
+
+    # Fetch the glossary once, here, rather than in every worker, but only
+    # if a serial render would fetch it too.
+    if any(
+        _uses_glossary(kind, page)
+        for kind, kind_pages in pages.items()
+        for page in kind_pages.values()
+    ):
+        load_glossary_labels()
+
+    rendered = {kind: {} for kind in pages}
+    with get_process_pool(jobs, _init_worker, (config,)) as executor:
+        futures = [
+            (
+                kind,
+                chunk,
+                executor.submit(
+                    _render_pages_in_worker, kind, [page for _, page in chunk]
+                ),
+            )
+            for kind, chunk in tasks
+        ]
+        for kind, chunk, future in futures:
+            rendered[kind].update(zip((name for name, _ in chunk), future.result()))
+
+    return rendered
 
 
 def render_linkml_documentation(
     linkml_documentation: LinkMLDocumentation, config: Config
 ) -> RenderedLinkMLDocumentation:
+    """Renders the pages of the documentation.
+
+    With `config["jobs"]` above 1, class and enumeration pages are rendered
+    in that many processes, with the same result.
+    """
+
+    jobs = config.get("jobs", 1)
+
+    if jobs > 1:
+        pages = _render_pages_in_parallel(
+            {
+                PageKind.CLASS_PAGE: linkml_documentation.class_pages,
+                PageKind.ENUMERATION_PAGE: linkml_documentation.enumeration_pages,
+            },
+            config,
+            jobs,
+        )
+        class_pages = pages[PageKind.CLASS_PAGE]
+        enumeration_pages = pages[PageKind.ENUMERATION_PAGE]
+    else:
+        class_pages = {
+            name: render_class_page(page, config)
+            for name, page in linkml_documentation.class_pages.items()
+        }
+        enumeration_pages = {
+            name: render_enumeration_page(page, config)
+            for name, page in linkml_documentation.enumeration_pages.items()
+        }
+
     linkml_documentation = LinkMLDocumentation(
         name=linkml_documentation.name,
         title=linkml_documentation.title,
-        index_page=render_index_page(linkml_documentation.index_page, config),
-        navigation_page=render_navigation_page(
-            linkml_documentation.navigation_page, config
+        index_page=(
+            render_index_page(linkml_documentation.index_page, config)
+            if linkml_documentation.index_page is not None
+            else None
         ),
-        class_pages={
-            name: render_class_page(page, config)
-            for name, page in linkml_documentation.class_pages.items()
-        },
+        navigation_page=(
+            render_navigation_page(linkml_documentation.navigation_page, config)
+            if linkml_documentation.navigation_page is not None
+            else None
+        ),
+        class_pages=class_pages,
         slot_pages={
             name: render_slot_page(page, config)
             for name, page in linkml_documentation.slot_pages.items()
         },
-        enumeration_pages={
-            name: render_enumeration_page(page, config)
-            for name, page in linkml_documentation.enumeration_pages.items()
-        },
+        enumeration_pages=enumeration_pages,
         type_pages={
             name: render_type_page(page, config)
             for name, page in linkml_documentation.type_pages.items()
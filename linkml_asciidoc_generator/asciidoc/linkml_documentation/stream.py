@@ -0,0 +1,62 @@
+import time
+from collections.abc import Iterator
+
+from linkml_asciidoc_generator.linkml.model import CompiledSchema
+from linkml_asciidoc_generator.config import Config
+from linkml_asciidoc_generator.asciidoc import AsciiDocStr, RelativeFilePath
+from linkml_asciidoc_generator.asciidoc.class_page.generate import drop_shared_models
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.generate import (
+    generate_pages,
+)
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.prune import (
+    get_pruned_config,
+)
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.render import (
+    render_page,
+)
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.write import (
+    get_module_file_path,
+)
+
+
+def iter_linkml_documentation(
+    schema: CompiledSchema,
+    config: Config,
+    stage_times: dict[str, float] | None = None,
+) -> Iterator[tuple[RelativeFilePath, AsciiDocStr]]:
+    """The pages of the schema's documentation, one at a time, as their path
+    in the Antora module and their content.
+
+    Each page is generated and rendered when it is asked for. Apart from
+    what the compiled schema caches about itself, nothing of a page is kept
+    once it has been handed out: the models that class pages otherwise
+    share are dropped after every page. The pages and their order are those
+    written by `write_linkml_documentation`. A config that prunes the build
+    is applied to the schema first.
+
+    With `stage_times`, the seconds spent generating and rendering the pages
+    are added to its `"generate"` and `"render"` entries.
+    """
+
+    config = get_pruned_config(schema, config)
+    if stage_times is None:
+        stage_times = {}
+
+    pages = generate_pages(schema, config)
+    while True:
+        start = time.perf_counter()
+        try:
+            kind, name, page = next(pages)
+        except StopIteration:
+            return
+        finally:
+            drop_shared_models(schema)
+            generated = time.perf_counter()
+            stage_times["generate"] = stage_times.get("generate", 0.0) + generated - start
+
+        content = render_page(kind, page, config)
+        stage_times["render"] = (
+            stage_times.get("render", 0.0) + time.perf_counter() - generated
+        )
+
+        yield get_module_file_path(name, kind), content
@@ -1,6 +1,7 @@
 import os
 import os.path
 
+from collections.abc import Iterable
 from typing import IO
 from os import PathLike
 
@@ -9,7 +10,10 @@ from linkml_asciidoc_generator.asciidoc.linkml_documentation.model import (
 )
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc import (
+    AsciiDocStr,
     PageKind,
+    RelativeFilePath,
+    ResourceName,
     get_page_resource_id,
     CharEncoding,
 )
@@ -24,6 +28,42 @@ def _write_page(content: IO, file_path: PathLike, char_encoding: CharEncoding) -
         f.write(content.encode(char_encoding))
 
 
+def _make_module_dirs(config: Config) -> PathLike:
+    """Creates the directories of the Antora module, and returns the
+    module's directory."""
+
+    module_dir = config["output_dir"]
+
+    for family_dir in ("pages", "partials", "images", "attachments", "examples"):
+        os.makedirs(os.path.join(module_dir, family_dir), exist_ok=True)
+
+    return module_dir
+
+
+def get_module_file_path(name: ResourceName, kind: PageKind) -> RelativeFilePath:
+    """Where the page goes, relative to the directory of the Antora module."""
+
+    resource_id = get_page_resource_id(name, kind)
+    if kind is PageKind.NAVIGATION_PAGE:
+        return resource_id
+
+    return os.path.join("pages", resource_id)
+
+
+def write_pages(
+    pages: Iterable[tuple[RelativeFilePath, AsciiDocStr]], config: Config
+) -> None:
+    """Writes each page as soon as it comes in, to its path relative to the
+    Antora module's directory."""
+
+    module_dir = _make_module_dirs(config)
+
+    for file_path, content in pages:
+        _write_page(
+            content, os.path.join(module_dir, file_path), config["char_encoding"]
+        )
+
+
 def write_linkml_documentation(
     linkml_documentation: RenderedLinkMLDocumentation, config: Config
 ) -> None:
@@ -34,37 +74,29 @@ def write_linkml_documentation(
     """
 
     # module_dir = os.path.join(config["output_dir"], linkml_documentation.name.lower())
-    module_dir = config["output_dir"]
+    module_dir = _make_module_dirs(config)
 
     pages_dir = os.path.join(module_dir, "pages")
-    partials_dir = os.path.join(module_dir, "partials")
-    images_dir = os.path.join(module_dir, "images")
-    attachments_dir = os.path.join(module_dir, "attachments")
-    examples_dir = os.path.join(module_dir, "examples")
-
-    os.makedirs(pages_dir, exist_ok=True)
-    os.makedirs(partials_dir, exist_ok=True)
-    os.makedirs(images_dir, exist_ok=True)
-    os.makedirs(attachments_dir, exist_ok=True)
-    os.makedirs(examples_dir, exist_ok=True)
-
-    index_page_path = os.path.join(
-        pages_dir,
-        get_page_resource_id("index", PageKind.INDEX_PAGE),
-    )
-    _write_page(
-        linkml_documentation.index_page, index_page_path, config["char_encoding"]
-    )
-
-    navigation_page_path = os.path.join(
-        module_dir,
-        get_page_resource_id("nav", PageKind.NAVIGATION_PAGE),
-    )
-    _write_page(
-        linkml_documentation.navigation_page,
-        navigation_page_path,
-        config["char_encoding"],
-    )
+
+    if linkml_documentation.index_page is not None:
+        index_page_path = os.path.join(
+            pages_dir,
+            get_page_resource_id("index", PageKind.INDEX_PAGE),
+        )
+        _write_page(
+            linkml_documentation.index_page, index_page_path, config["char_encoding"]
+        )
+
+    if linkml_documentation.navigation_page is not None:
+        navigation_page_path = os.path.join(
+            module_dir,
+            get_page_resource_id("nav", PageKind.NAVIGATION_PAGE),
+        )
+        _write_page(
+            linkml_documentation.navigation_page,
+            navigation_page_path,
+            config["char_encoding"],
+        )
 
     for name, content in linkml_documentation.class_pages.items():
         if content is not None:
@@ -1,54 +1,59 @@
 from linkml_asciidoc_generator.linkml.model import (
-    LinkMLSchema,
+    CompiledSchema,
 )
-from linkml_asciidoc_generator.asciidoc import ResourceName
-from linkml_asciidoc_generator.asciidoc.class_page.model import Class
-from linkml_asciidoc_generator.asciidoc.enumeration_page.model import Enumeration
-from linkml_asciidoc_generator.asciidoc.class_page.generate import generate_class
-from linkml_asciidoc_generator.asciidoc.enumeration_page.generate import (
-    generate_enumeration,
+from linkml_asciidoc_generator.asciidoc import (
+    ResourceName,
+    is_cim_data_type,
+    is_pruned,
 )
-from linkml_asciidoc_generator.asciidoc.class_page.generate import is_cim_data_type
 from linkml_asciidoc_generator.config import Config
-from linkml_asciidoc_generator.asciidoc.navigation_page.model import NavigationPage
-
+from linkml_asciidoc_generator.asciidoc.navigation_page.model import (
+    NavigationItem,
+    NavigationPage,
+)
 
-def _get_classes(schema: LinkMLSchema, config: Config) -> dict[ResourceName, Class]:
-    classes = {}
-    for class_name, class_ in schema.classes.items():
-        if not is_cim_data_type(class_):
-            classes[class_name] = generate_class(class_, schema, config)
 
-    return classes
+def _get_classes(
+    schema: CompiledSchema, config: Config
+) -> dict[ResourceName, NavigationItem]:
+    return {
+        class_name: NavigationItem(name=class_name, is_root=bool(class_.tree_root))
+        for class_name, class_ in schema.classes.items()
+        if not is_cim_data_type(class_) and not is_pruned(class_name, config)
+    }
 
 
 def _get_enumerations(
-    schema: LinkMLSchema, config: Config
-) -> dict[ResourceName, Enumeration]:
-    # TODO: Hacky, but works.
-    if schema.enums is None:
-        linkml_enums = {}
-    else:
-        linkml_enums = schema.enums
-
+    schema: CompiledSchema, config: Config
+) -> dict[ResourceName, NavigationItem]:
     return {
-        enum_name: generate_enumeration(enum, schema)
-        for enum_name, enum in linkml_enums.items()
+        enum_name: NavigationItem(name=enum_name)
+        for enum_name in schema.enums
+        if not is_pruned(enum_name, config)
     }
 
 
 def _get_cim_data_types(
-    schema: LinkMLSchema, config: Config
-) -> dict[ResourceName, Class]:
-    cim_data_types = {}
-    for class_name, class_ in schema.classes.items():
-        if is_cim_data_type(class_):
-            cim_data_types[class_name] = generate_class(class_, schema, config)
+    schema: CompiledSchema, config: Config
+) -> dict[ResourceName, NavigationItem]:
+    return {
+        class_name: NavigationItem(name=class_name)
+        for class_name, class_ in schema.classes.items()
+        if is_cim_data_type(class_) and not is_pruned(class_name, config)
+    }
+
 
-    return cim_data_types
+def _get_types(
+    schema: CompiledSchema, config: Config
+) -> dict[ResourceName, NavigationItem]:
+    return {
+        type_.name: NavigationItem(name=type_.name)
+        for type_ in schema.ranges.get_custom_types()
+        if not is_pruned(type_.name, config)
+    }
 
 
-def generate_navigation_page(schema: LinkMLSchema, config: Config) -> NavigationPage:
+def generate_navigation_page(schema: CompiledSchema, config: Config) -> NavigationPage:
     navigation_page = NavigationPage(
         name="nav",
         title="Navigation",
@@ -56,6 +61,7 @@ def generate_navigation_page(schema: LinkMLSchema, config: Config) -> Navigation
         classes=_get_classes(schema, config),
         enumerations=_get_enumerations(schema, config),
         cim_data_types=_get_cim_data_types(schema, config),
+        types=_get_types(schema, config),
     )
 
     return navigation_page
@@ -1,12 +1,20 @@
 from dataclasses import dataclass
 from linkml_asciidoc_generator.asciidoc import Page
 from linkml_asciidoc_generator.asciidoc import ResourceName
-from linkml_asciidoc_generator.asciidoc.class_page.model import Class
-from linkml_asciidoc_generator.asciidoc.enumeration_page.model import Enumeration
+
+
+@dataclass
+class NavigationItem:
+    """What the navigation needs of a class, enumeration or type: its name,
+    not the full model of its page."""
+
+    name: ResourceName
+    is_root: bool = False
 
 
 @dataclass
 class NavigationPage(Page):
-    classes: dict[ResourceName, Class]
-    enumerations: dict[ResourceName, Enumeration]
-    cim_data_types: dict[ResourceName, Class]
+    classes: dict[ResourceName, NavigationItem]
+    enumerations: dict[ResourceName, NavigationItem]
+    cim_data_types: dict[ResourceName, NavigationItem]
+    types: dict[ResourceName, NavigationItem]
@@ -1,3 +1,5 @@
+from functools import partial
+
 from linkml_asciidoc_generator.asciidoc import (
     AsciiDocStr,
     read_jinja2_template,
@@ -8,12 +10,14 @@ from linkml_asciidoc_generator.asciidoc import (
 from linkml_asciidoc_generator.asciidoc import ResourceName
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc.navigation_page.model import (
+    NavigationItem,
     NavigationPage,
 )
-from linkml_asciidoc_generator.asciidoc.class_page.model import Class
 
 
-def _get_root_class(classes: dict[ResourceName, Class]) -> Class | None:
+def _get_root_class(
+    classes: dict[ResourceName, NavigationItem],
+) -> NavigationItem | None:
     for class_ in classes.values():
         if class_.is_root:
             return class_
@@ -27,8 +31,8 @@ def render_navigation_page(
     content = template.render(
         page=navigation_page,
         root_class=_get_root_class(navigation_page.classes),
-        xref_class=xref_class,
-        xref_enum=xref_enum,
+        xref_class=partial(xref_class, config=config),
+        xref_enum=partial(xref_enum, config=config),
     )
 
     return content
@@ -1,6 +1,44 @@
-from linkml_asciidoc_generator.linkml.model import LinkMLType
+from linkml_asciidoc_generator.linkml.model import CompiledSchema, CompiledType
+from linkml_asciidoc_generator.linkml.ranges import RangeKind
 from linkml_asciidoc_generator.config import Config
-from linkml_asciidoc_generator.asciidoc.type_page.model import TypePage
+from linkml_asciidoc_generator.asciidoc.type_page.model import TypePage, Type
+from linkml_asciidoc_generator.asciidoc import (
+    get_skos_mappings,
+    generate_used_by,
+)
 
 
-def generate_type_page(class_: LinkMLType, config: Config) -> TypePage: ...
+def generate_type(type_: CompiledType, schema: CompiledSchema) -> Type:
+    typeof = schema.ranges.resolve(type_.typeof) if type_.typeof else None
+
+    return Type(
+        name=type_.name,
+        prefixes=schema.prefixes,
+        uri=type_.uri,
+        typeof=(
+            typeof.primitive
+            if typeof is not None and typeof.kind is RangeKind.PRIMITIVE
+            else type_.typeof
+        ),
+        typeof_kind=None if typeof is None else typeof.kind,
+        base=schema.ranges.resolve(type_.name).primitive,
+        description=type_.description,
+        used_by=generate_used_by(type_, schema),
+        skos_mappings=get_skos_mappings(type_),
+        see_also=type_.see_also,
+    )
+
+
+def generate_type_page(
+    type_: CompiledType, schema: CompiledSchema, config: Config
+) -> TypePage:
+    _type_ = generate_type(type_, schema)
+
+    type_page = TypePage(
+        name=_type_.name,
+        type_=_type_,
+        template=config["templates"]["type_page"],
+        title=type_.title or _type_.name,
+    )
+
+    return type_page
@@ -1,6 +1,30 @@
 from dataclasses import dataclass
-from linkml_asciidoc_generator.asciidoc import Page
+from linkml_asciidoc_generator.asciidoc import (
+    Page,
+    PrefixesMap,
+    CURIE,
+    URI,
+    SkosMapping,
+    UsedByMap,
+)
+from linkml_asciidoc_generator.linkml.model import LinkMLElementName, LinkMLPrimitive
+from linkml_asciidoc_generator.linkml.ranges import RangeKind
 
 
 @dataclass
-class TypePage(Page): ...
+class Type:
+    name: LinkMLElementName
+    prefixes: PrefixesMap
+    uri: CURIE | None = None
+    typeof: LinkMLPrimitive | LinkMLElementName | None = None
+    typeof_kind: RangeKind | None = None
+    base: LinkMLPrimitive | None = None  # At the end of the `typeof` chain.
+    description: str | None = None
+    used_by: UsedByMap | None = None
+    skos_mappings: SkosMapping | None = None
+    see_also: list[URI] | None = None
+
+
+@dataclass
+class TypePage(Page):
+    type_: Type
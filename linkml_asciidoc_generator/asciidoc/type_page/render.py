@@ -1,6 +1,29 @@
-from linkml_asciidoc_generator.asciidoc import AsciiDocStr
+from functools import partial
+
+from linkml_asciidoc_generator.asciidoc import (
+    AsciiDocStr,
+    Jinja2TemplateStr,
+    read_jinja2_template,
+    label_for,
+    link_curie,
+    xref_class,
+    xref_slot,
+    xref_type,
+)
 from linkml_asciidoc_generator.config import Config
 from linkml_asciidoc_generator.asciidoc.type_page.model import TypePage
 
 
-def render_type_page(type_page: TypePage, config: Config) -> AsciiDocStr: ...
+def render_type_page(type_page: TypePage, config: Config) -> AsciiDocStr:
+    template: Jinja2TemplateStr = read_jinja2_template("type_page", config)
+
+    content = template.render(
+        type_=type_page.type_,
+        link_curie=partial(link_curie, prefixes=type_page.type_.prefixes),
+        label_for=partial(label_for, prefixes=type_page.type_.prefixes),
+        xref_class=partial(xref_class, config=config),
+        xref_slot=partial(xref_slot, config=config),
+        xref_type=partial(xref_type, config=config),
+    )
+
+    return content
@@ -0,0 +1,115 @@
+import argparse
+import glob
+import logging
+import sys
+
+from pathlib import Path
+from typing import Sequence
+
+from linkml_asciidoc_generator.config import Config
+from linkml_asciidoc_generator.main import (
+    BuildTimings,
+    add_build_arguments,
+    configure_logging,
+    create_linkml_documentation,
+    get_config,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_schema_files(patterns: Sequence[str]) -> list[Path]:
+    """Expands the given paths and glob patterns to schema files.
+
+    Every pattern's matches are sorted, and schemas matched more than once are
+    only built once.
+    """
+
+    schema_files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for match in map(Path, matches):
+            if match not in schema_files:
+                schema_files.append(match)
+
+    return schema_files
+
+
+def _check_output_dirs(schema_files: Sequence[Path]) -> None:
+    """Makes sure that no two schemas would be written to the same
+    directory."""
+
+    by_stem = {}
+    for schema_file in schema_files:
+        by_stem.setdefault(schema_file.stem, []).append(schema_file)
+
+    collisions = [files for files in by_stem.values() if len(files) > 1]
+    if collisions:
+        raise ValueError(
+            "Schemas would be written to the same output directory: "
+            + "; ".join(", ".join(map(str, files)) for files in collisions)
+        )
+
+
+def create_linkml_documentation_batch(
+    schema_files: Sequence[Path], output_root: Path, config: Config
+) -> list[BuildTimings]:
+    """Builds the documentation of every schema in this one process.
+
+    Each schema is written to a directory named after it under `output_root`,
+    so schemas must have different names. A schema that fails to build is
+    logged and skipped; the timings are those of the schemas that were
+    built. Loaded (imported) schemas, Jinja2 templates and glossary labels
+    are kept for the lifetime of the process, so later builds reuse them.
+    """
+
+    _check_output_dirs(schema_files)
+
+    timings = []
+    for schema_file in schema_files:
+        schema_config = config | {"output_dir": output_root / schema_file.stem}
+        try:
+            timings.append(create_linkml_documentation(schema_file, schema_config))
+        except Exception:
+            logger.exception("Could not build %s; skipping it", schema_file)
+
+    return timings
+
+
+def print_batch_timings(timings: Sequence[BuildTimings]) -> None:
+    stages = ("load", "compile", "generate", "render", "write", "total")
+    name_width = max([len("schema"), *(len(t.schema_file.stem) for t in timings)])
+
+    print(f"{'schema':<{name_width}}" + "".join(f"{s:>10}" for s in stages))
+    for t in timings:
+        print(
+            f"{t.schema_file.stem:<{name_width}}"
+            + "".join(f"{getattr(t, s):>9.3f}s" for s in stages)
+        )
+    print(
+        f"{'total':<{name_width}}"
+        + "".join(f"{sum(getattr(t, s) for t in timings):>9.3f}s" for s in stages)
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="build the documentation of several schemas in one process")
+    parser.add_argument("schemas", help="paths or glob patterns of the LinkML schemas", nargs="+")
+    parser.add_argument("-o", "--output-root", help="directory to write an Antora module per schema to", default=Path("./output"), type=Path)
+    add_build_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_logging(args)
+    config = get_config(args, args.output_root)
+
+    schema_files = get_schema_files(args.schemas)
+    logger.info("Building %d schemas", len(schema_files))
+
+    timings = create_linkml_documentation_batch(schema_files, args.output_root, config)
+    print_batch_timings(timings)
+
+    if len(timings) < len(schema_files):
+        logger.error("Built %d of %d schemas", len(timings), len(schema_files))
+        sys.exit(1)
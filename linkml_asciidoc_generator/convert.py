@@ -0,0 +1,23 @@
+import argparse
+
+from pathlib import Path
+
+from linkml_asciidoc_generator.linkml.read import (
+    JSON_SCHEMA_SUFFIX,
+    convert_linkml_schema_to_json,
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="convert LinkML schemas from YAML to JSON, which loads faster")
+    parser.add_argument("schemas", help="paths to the LinkML schemas", nargs="+", type=Path)
+    parser.add_argument("-o", "--output-dir", help="directory to write the JSON schemas to (defaults to next to each schema)", type=Path)
+
+    args = parser.parse_args()
+
+    for schema_file in args.schemas:
+        output_dir = args.output_dir or schema_file.parent
+        output_dir.mkdir(parents=True, exist_ok=True)
+        convert_linkml_schema_to_json(
+            schema_file, output_dir / schema_file.with_suffix(JSON_SCHEMA_SUFFIX).name
+        )
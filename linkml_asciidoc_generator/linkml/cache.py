@@ -0,0 +1,129 @@
+import hashlib
+import logging
+import os
+import pickle
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from linkml_asciidoc_generator.linkml.model import LinkMLSchema
+from linkml_asciidoc_generator.linkml.model.metamodel import metamodel_version
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "linkml-asciidoc-generator"
+)
+DEFAULT_MAX_CACHE_SIZE = 512 * 1024 * 1024  # Bytes.
+
+CACHE_FILE_SUFFIX = ".pickle"
+
+try:
+    GENERATOR_VERSION = version("linkml-asciidoc-generator")
+except PackageNotFoundError:  # Running from a source checkout.
+    GENERATOR_VERSION = "unknown"
+
+
+type CacheKey = str
+
+
+@cache
+def _get_source_hash() -> str:
+    """Hash of the code that reads and parses schemas.
+
+    In a source checkout or an editable install, the generator version does
+    not change when the code does; this does.
+    """
+
+    h = hashlib.sha256()
+    source_dir = Path(__file__).parent
+    for source_file in sorted(source_dir.rglob("*.py")):
+        h.update(source_file.relative_to(source_dir).as_posix().encode("utf8"))
+        h.update(b"\0")
+        h.update(source_file.read_bytes())
+
+    return h.hexdigest()
+
+
+def get_cache_key(schema_bytes: bytes, *variant: str) -> CacheKey:
+    """Content address of a parsed schema.
+
+    Besides the schema bytes, the key covers the metamodel version, the
+    generator version and the code that parses schemas, so upgrading or
+    changing either invalidates old entries. Any further parse options that
+    affect the result are passed as `variant`.
+    """
+
+    h = hashlib.sha256()
+    for part in (metamodel_version, GENERATOR_VERSION, _get_source_hash(), *variant):
+        h.update(part.encode("utf8"))
+        h.update(b"\0")
+    h.update(schema_bytes)
+
+    return h.hexdigest()
+
+
+def _get_cache_file(key: CacheKey, cache_dir: Path) -> Path:
+    return cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+
+def read_cached_linkml_schema(key: CacheKey, cache_dir: Path) -> LinkMLSchema | None:
+    cache_file = _get_cache_file(key, cache_dir)
+
+    try:
+        with cache_file.open(mode="rb") as f:
+            schema = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+        logger.warning("Ignoring unreadable cache entry %s: %s", cache_file, e)
+        cache_file.unlink(missing_ok=True)
+        return None
+
+    # Mark as recently used for eviction.
+    os.utime(cache_file)
+
+    return schema
+
+
+def write_cached_linkml_schema(
+    key: CacheKey,
+    schema: LinkMLSchema,
+    cache_dir: Path,
+    max_size: int = DEFAULT_MAX_CACHE_SIZE,
+) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = _get_cache_file(key, cache_dir)
+
+    # Write to a temporary file first so concurrent builds never see a
+    # partially written entry.
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_file.open(mode="wb") as f:
+        pickle.dump(schema, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, cache_file)
+
+    evict_cached_linkml_schemas(cache_dir, max_size)
+
+
+def evict_cached_linkml_schemas(cache_dir: Path, max_size: int) -> None:
+    """Removes the least recently used entries until the cache fits `max_size`."""
+
+    entries = []
+    for cache_file in cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+        try:
+            stat = cache_file.stat()
+        except FileNotFoundError:  # Evicted by a concurrent build.
+            continue
+        entries.append((stat.st_mtime, stat.st_size, cache_file))
+
+    total_size = sum(size for _, size, _ in entries)
+
+    for _, size, cache_file in sorted(entries):
+        if total_size <= max_size:
+            break
+
+        logger.info("Evicting cache entry %s", cache_file)
+        cache_file.unlink(missing_ok=True)
+        total_size -= size
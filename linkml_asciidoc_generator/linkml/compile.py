@@ -0,0 +1,170 @@
+import sys
+
+from linkml_asciidoc_generator.linkml.index import build_schema_index
+from linkml_asciidoc_generator.linkml.ranges import build_range_registry
+from linkml_asciidoc_generator.linkml.slot_table import build_slot_table
+from linkml_asciidoc_generator.linkml.model import (
+    LinkMLSchema,
+    CompiledClass,
+    CompiledElement,
+    CompiledEnum,
+    CompiledPermissibleValue,
+    CompiledSchema,
+    CompiledSlot,
+    CompiledType,
+)
+
+
+def _intern(s: str | None) -> str | None:
+    return None if s is None else sys.intern(s)
+
+
+def _tuple(values: list | None) -> tuple | None:
+    return None if values is None else tuple(values)
+
+
+def _link(record: CompiledElement, **fields) -> None:
+    """Sets reference fields on an already built (frozen) record."""
+
+    for field_name, value in fields.items():
+        object.__setattr__(record, field_name, value)
+
+
+def _compile_element_fields(name: str, element) -> dict:
+    return dict(
+        name=sys.intern(name),
+        title=element.title,
+        description=element.description,
+        from_schema=element.from_schema,
+        see_also=_tuple(element.see_also),
+        mappings=_tuple(element.mappings),
+        exact_mappings=_tuple(element.exact_mappings),
+        close_mappings=_tuple(element.close_mappings),
+        narrow_mappings=_tuple(element.narrow_mappings),
+        broad_mappings=_tuple(element.broad_mappings),
+    )
+
+
+def _compile_slot(name: str, slot, owner: CompiledClass | None) -> CompiledSlot:
+    return CompiledSlot(
+        **_compile_element_fields(name, slot),
+        slot_uri=slot.slot_uri,
+        is_a=_intern(slot.is_a),
+        range=_intern(slot.range),
+        required=slot.required,
+        multivalued=slot.multivalued,
+        identifier=slot.identifier,
+        owner=owner,
+    )
+
+
+def _compile_class(name: str, class_) -> CompiledClass:
+    compiled_class = CompiledClass(
+        **_compile_element_fields(name, class_),
+        class_uri=class_.class_uri,
+        is_a=_intern(class_.is_a),
+        mixins=tuple(map(sys.intern, class_.mixins or [])),
+        abstract=bool(class_.abstract),
+        mixin=bool(class_.mixin),
+        tree_root=bool(class_.tree_root),
+        slots=tuple(map(sys.intern, class_.slots or [])),
+    )
+    _link(
+        compiled_class,
+        attributes=tuple(
+            _compile_slot(slot_name, slot, compiled_class)
+            for slot_name, slot in (class_.attributes or {}).items()
+        ),
+        slot_usage=tuple(
+            _compile_slot(slot_name, slot, compiled_class)
+            for slot_name, slot in (class_.slot_usage or {}).items()
+        ),
+    )
+
+    return compiled_class
+
+
+def _compile_enum(name: str, enum) -> CompiledEnum:
+    return CompiledEnum(
+        **_compile_element_fields(name, enum),
+        enum_uri=enum.enum_uri,
+        permissible_values=tuple(
+            CompiledPermissibleValue(
+                text=text,
+                description=pv.description,
+                meaning=pv.meaning,
+            )
+            for text, pv in (enum.permissible_values or {}).items()
+        ),
+    )
+
+
+def _compile_type(name: str, type_) -> CompiledType:
+    return CompiledType(
+        **_compile_element_fields(name, type_),
+        uri=type_.uri,
+        typeof=_intern(type_.typeof),
+        base=type_.base,
+        repr=type_.repr,
+    )
+
+
+def compile_linkml_schema(schema: LinkMLSchema) -> CompiledSchema:
+    """Builds the compact representation of the parsed schema.
+
+    Names are interned, and `is_a`, `typeof` and slot ranges are resolved to
+    direct references to the records they name. Range names are resolved to
+    their kind once, in a registry.
+    """
+
+    classes = {
+        name: _compile_class(name, class_)
+        for name, class_ in (schema.classes or {}).items()
+    }
+    slots = {
+        name: _compile_slot(name, slot, None)
+        for name, slot in (schema.slots or {}).items()
+    }
+    enums = {name: _compile_enum(name, enum) for name, enum in (schema.enums or {}).items()}
+    types = {name: _compile_type(name, type_) for name, type_ in (schema.types or {}).items()}
+
+    for class_ in classes.values():
+        _link(class_, parent=classes.get(class_.is_a))
+
+    for type_ in types.values():
+        _link(type_, parent=types.get(type_.typeof))
+
+    ranges = {**types, **enums, **classes}
+    all_slots = list(slots.values())
+    for class_ in classes.values():
+        all_slots.extend(class_.attributes)
+        all_slots.extend(class_.slot_usage)
+    for slot in all_slots:
+        _link(slot, range_element=ranges.get(slot.range))
+
+    default_range = _intern(schema.default_range)
+    range_registry = build_range_registry(types, enums, classes, default_range)
+
+    index = build_schema_index(classes, slots)
+    # Slots refined by `slot_usage` only exist once slots are induced.
+    for class_ in classes.values():
+        all_slots.extend(slot for _, slot in index.get_induced_slots(class_))
+
+    return CompiledSchema(
+        id=schema.id,
+        name=schema.name,
+        title=schema.title,
+        description=schema.description,
+        version=schema.version,
+        imports=tuple(schema.imports or []),
+        prefixes=dict(schema.prefixes or {}),
+        default_prefix=schema.default_prefix,
+        default_range=default_range,
+        classes=classes,
+        slots=slots,
+        enums=enums,
+        types=types,
+        index=index,
+        ranges=range_registry,
+        slot_table=build_slot_table(all_slots, range_registry),
+    )
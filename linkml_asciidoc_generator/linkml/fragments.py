@@ -0,0 +1,150 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Sequence
+
+from linkml_asciidoc_generator.linkml.model import LinkMLSchema, Metamodel
+from linkml_asciidoc_generator.linkml.read import read_linkml_schema
+from linkml_asciidoc_generator.linkml.parse import (
+    ParseMode,
+    intern_schema_strings,
+    parse_linkml_schema,
+)
+from linkml_asciidoc_generator.linkml.imports import MERGED_FIELDS
+
+
+FRAGMENT_FILE_PATTERNS = ("*.yaml", "*.yml")
+
+# Fields of the schema itself, which only the header fragment may set.
+HEADER_FIELDS = ("id", "name")
+
+
+class SchemaFragmentError(ValueError):
+    pass
+
+
+def get_linkml_schema_fragments(schema_dir: Path) -> list[Path]:
+    """The fragment files of a schema split across a directory, by name."""
+
+    return sorted(
+        fragment_file
+        for pattern in FRAGMENT_FILE_PATTERNS
+        for fragment_file in schema_dir.glob(pattern)
+    )
+
+
+def _parse_linkml_schema_fragment(
+    fragment_file: Path, mode: ParseMode, metamodel: Metamodel
+) -> tuple[LinkMLSchema, bool]:
+    """Parses a fragment, telling whether it is the header fragment.
+
+    Fragments other than the header do not have the fields every schema
+    requires; they are validated with those fields set to the file name.
+    """
+
+    fragment_dict = read_linkml_schema(fragment_file) or {}
+    is_header = "id" in fragment_dict
+
+    if not is_header:
+        for field_name in HEADER_FIELDS:
+            fragment_dict.setdefault(field_name, fragment_file.stem)
+
+    return parse_linkml_schema(fragment_dict, mode, metamodel), is_header
+
+
+def merge_linkml_schema_fragments(
+    fragments: Sequence[tuple[Path, LinkMLSchema, bool]],
+) -> LinkMLSchema:
+    """Merges the elements of the fragments into the header fragment.
+
+    Elements are ordered by fragment, then as they are in their fragment.
+    An element defined in more than one fragment, or a prefix with
+    differing expansions, is an error.
+    """
+
+    header_files = [
+        fragment_file for fragment_file, _, is_header in fragments if is_header
+    ]
+    if len(header_files) != 1:
+        raise SchemaFragmentError(
+            f"Expected exactly one fragment with the schema `id`, found {len(header_files)}"
+            + (f": {', '.join(map(str, header_files))}" if header_files else "")
+        )
+
+    header = next(fragment for _, fragment, is_header in fragments if is_header)
+
+    update = {}
+    for field_name in MERGED_FIELDS:
+        merged = {}
+        defined_in = {}
+
+        for fragment_file, fragment, _ in fragments:
+            for name, value in (getattr(fragment, field_name) or {}).items():
+                if name not in merged:
+                    merged[name] = value
+                    defined_in[name] = fragment_file
+                elif field_name != "prefixes" or merged[name] != value:
+                    raise SchemaFragmentError(
+                        f"Duplicate {field_name} entry {name!r} in"
+                        f" {defined_in[name]} and {fragment_file}"
+                    )
+
+        if merged or getattr(header, field_name) is not None:
+            update[field_name] = merged
+
+    imports = list(header.imports or [])
+    for _, fragment, is_header in fragments:
+        if not is_header:
+            imports.extend(i for i in fragment.imports or [] if i not in imports)
+    if imports:
+        update["imports"] = imports
+
+    return header.model_copy(update=update)
+
+
+def parse_linkml_schema_fragments(
+    schema_dir: Path,
+    mode: ParseMode = ParseMode.STRICT,
+    metamodel: Metamodel = Metamodel.PROJECTION,
+    max_workers: int | None = None,
+) -> LinkMLSchema:
+    """Reads and validates the fragments in a process pool and merges them.
+
+    Exactly one fragment is the header, with the schema's `id`, `name` and
+    other metadata. The others hold classes, enums and other elements, and
+    may add prefixes and imports.
+    """
+
+    fragment_files = get_linkml_schema_fragments(schema_dir)
+    if not fragment_files:
+        raise SchemaFragmentError(f"No schema fragments in {schema_dir}")
+
+    max_workers = min(len(fragment_files), max_workers or os.cpu_count() or 1)
+
+    if max_workers == 1:
+        parsed = [
+            _parse_linkml_schema_fragment(fragment_file, mode, metamodel)
+            for fragment_file in fragment_files
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            parsed = list(
+                executor.map(
+                    _parse_linkml_schema_fragment,
+                    fragment_files,
+                    [mode] * len(fragment_files),
+                    [metamodel] * len(fragment_files),
+                )
+            )
+
+    schema = merge_linkml_schema_fragments(
+        [
+            (fragment_file, fragment, is_header)
+            for fragment_file, (fragment, is_header) in zip(fragment_files, parsed)
+        ]
+    )
+
+    # Strings interned by the workers arrive here as copies.
+    intern_schema_strings(schema)
+
+    return schema
@@ -0,0 +1,72 @@
+from pathlib import Path
+from typing import Sequence
+
+from linkml_asciidoc_generator.linkml.model import LinkMLSchema
+
+
+BUNDLED_SCHEMAS_DIR = Path(__file__).parent / "schemas"
+BUNDLED_IMPORTS = {
+    "linkml:types": BUNDLED_SCHEMAS_DIR / "types.yaml",
+}
+
+SCHEMA_FILE_SUFFIXES = ("", ".yaml", ".yml", ".json")
+
+MERGED_FIELDS = ("prefixes", "subsets", "types", "enums", "slots", "classes")
+
+
+def _get_import_file_names(import_name: str) -> list[str]:
+    names = [import_name]
+
+    # For a CURIE or URI, fall back on its last path segment, e.g.
+    # `cim:TC57CIM` or `https://example.org/schemas/TC57CIM` to `TC57CIM`.
+    if ":" in import_name:
+        names.append(import_name.rstrip("/").rsplit("/", 1)[-1].rsplit(":", 1)[-1])
+
+    return names
+
+
+def resolve_linkml_import(
+    import_name: str, schema_dir: Path, search_paths: Sequence[Path] = ()
+) -> Path | None:
+    """Finds the local file for an entry of a schema's `imports`.
+
+    Bundled schemas go first, then the directory of the importing schema,
+    then the search paths in order.
+    """
+
+    if import_name in BUNDLED_IMPORTS:
+        return BUNDLED_IMPORTS[import_name]
+
+    for base_dir in [schema_dir, *search_paths]:
+        for file_name in _get_import_file_names(import_name):
+            for suffix in SCHEMA_FILE_SUFFIXES:
+                import_file = Path(base_dir) / f"{file_name}{suffix}"
+                if import_file.is_file():
+                    return import_file
+
+    return None
+
+
+def merge_linkml_schemas(
+    schema: LinkMLSchema, imported_schemas: Sequence[LinkMLSchema]
+) -> LinkMLSchema:
+    """Merges the elements and prefixes of the imported schemas into the schema.
+
+    Definitions in the importing schema take precedence over imported ones
+    with the same name. Neither of the given schemas is modified.
+    """
+
+    if not imported_schemas:
+        return schema
+
+    update = {}
+    for field_name in MERGED_FIELDS:
+        merged = dict(getattr(schema, field_name) or {})
+        for imported_schema in imported_schemas:
+            for name, value in (getattr(imported_schema, field_name) or {}).items():
+                merged.setdefault(name, value)
+
+        if merged:
+            update[field_name] = merged
+
+    return schema.model_copy(update=update)
@@ -0,0 +1,368 @@
+from dataclasses import dataclass, field, fields, replace
+from typing import Callable
+
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledClass,
+    CompiledElement,
+    CompiledSlot,
+    LinkMLClassName,
+    LinkMLElementName,
+    LinkMLSlotName,
+)
+from linkml_asciidoc_generator.linkml.relation_graph import (
+    RelationGraph,
+    build_relation_graph,
+)
+
+
+# A slot of a class, with the class that declares it.
+type InducedSlot = tuple[LinkMLClassName, CompiledSlot]
+
+# Fields a `slot_usage` entry can refine.
+REFINED_SLOT_FIELDS = tuple(
+    f.name for f in fields(CompiledSlot) if f.name not in ("name", "owner")
+)
+
+
+class InheritanceError(ValueError):
+    pass
+
+
+class InheritanceCycleError(InheritanceError):
+    pass
+
+
+def _get_cycle_error(
+    path: list[CompiledClass], class_: CompiledClass
+) -> InheritanceCycleError:
+    """The error for finding the class again on the path that led to it."""
+
+    cycle = [c.name for c in path[path.index(class_) :]] + [class_.name]
+
+    return InheritanceCycleError(
+        f"Class {class_.name!r} inherits from itself: {' -> '.join(cycle)}"
+    )
+
+
+def _merge_linearizations(
+    class_: CompiledClass, linearizations: list[list[CompiledClass]]
+) -> list[CompiledClass]:
+    """The merge step of C3: repeatedly takes the first head that is in no
+    other list's tail."""
+
+    merged = []
+    linearizations = [
+        linearization for linearization in linearizations if linearization
+    ]
+
+    while linearizations:
+        for linearization in linearizations:
+            head = linearization[0]
+            if not any(head in other[1:] for other in linearizations):
+                break
+        else:
+            raise InheritanceError(
+                f"Cannot order the superclasses of {class_.name!r} consistently:"
+                f" {', '.join(sorted({other[0].name for other in linearizations}))}"
+                " each have to come before another"
+            )
+
+        merged.append(head)
+        linearizations = [
+            rest
+            for rest in (
+                linearization[1:] if linearization[0] is head else linearization
+                for linearization in linearizations
+            )
+            if rest
+        ]
+
+    return merged
+
+
+def _refine_slot(slot: CompiledSlot, slot_usage: CompiledSlot) -> CompiledSlot:
+    refinements = {
+        field_name: value
+        for field_name in REFINED_SLOT_FIELDS
+        if (value := getattr(slot_usage, field_name)) is not None
+    }
+
+    return replace(slot, **refinements) if refinements else slot
+
+
+@dataclass
+class SchemaIndex:
+    """Lookups over the classes of a compiled schema that would otherwise
+    scan all of them.
+
+    Built once per schema by `compile_linkml_schema`. Ancestor chains,
+    method resolution orders, induced slots, used-by lists, the subclass
+    closure and the relation graph are computed on first use and kept.
+    """
+
+    classes: dict[LinkMLClassName, CompiledClass]
+    slots: dict[LinkMLSlotName, CompiledSlot]
+    children: dict[LinkMLClassName, tuple[CompiledClass, ...]]
+    _ancestors: dict[LinkMLClassName, tuple[CompiledClass, ...]] = field(
+        default_factory=dict, repr=False
+    )
+    _mros: dict[LinkMLClassName, tuple[CompiledClass, ...]] = field(
+        default_factory=dict, repr=False
+    )
+    _induced_slots: dict[LinkMLClassName, dict[LinkMLSlotName, InducedSlot]] = (
+        field(default_factory=dict, repr=False)
+    )
+    _used_by: dict[LinkMLElementName, tuple[InducedSlot, ...]] | None = field(
+        default=None, repr=False
+    )
+    _relation_graph: RelationGraph | None = field(default=None, repr=False)
+    # Transitive closure of `children`: bit `i` of a class's closure is set
+    # if it is, or descends from, the `i`-th class of `classes`.
+    _subclass_closures: dict[LinkMLClassName, int] | None = field(
+        default=None, repr=False
+    )
+    _class_ids: dict[LinkMLClassName, int] = field(default_factory=dict, repr=False)
+    # The classes by id, to turn closures back into classes.
+    _classes_by_id: list[CompiledClass] = field(default_factory=list, repr=False)
+
+    def get_children(self, class_: CompiledClass) -> tuple[CompiledClass, ...]:
+        return self.children.get(class_.name, ())
+
+    def get_used_by(self, element: CompiledElement) -> tuple[InducedSlot, ...]:
+        """Slots with the element as range, each with the class that has
+        it, in schema order.
+
+        These are the attributes and slots a class declares itself, as
+        refined by its `slot_usage`.
+        """
+
+        if self._used_by is None:
+            used_by = {}
+            for class_ in self.classes.values():
+                for owner, slot in self.get_induced_slots(class_):
+                    if owner == class_.name and slot.range is not None:
+                        used_by.setdefault(slot.range, []).append((owner, slot))
+
+            self._used_by = {name: tuple(slots) for name, slots in used_by.items()}
+
+        return self._used_by.get(element.name, ())
+
+    def _get_subclass_closures(self) -> dict[LinkMLClassName, int]:
+        if self._subclass_closures is not None:
+            return self._subclass_closures
+
+        self._class_ids = {name: i for i, name in enumerate(self.classes)}
+        self._classes_by_id = list(self.classes.values())
+        closures = {}
+
+        # Children before their parents, depth first, without recursing.
+        for root in self.classes.values():
+            if root.name in closures:
+                continue
+
+            path = [root]
+            pending = [iter(self.get_children(root))]
+            while path:
+                child = next((c for c in pending[-1] if c.name not in closures), None)
+                if child is None:
+                    current = path.pop()
+                    pending.pop()
+                    closure = 1 << self._class_ids[current.name]
+                    for c in self.get_children(current):
+                        closure |= closures[c.name]
+                    closures[current.name] = closure
+                elif child in path:
+                    raise _get_cycle_error(path, child)
+                else:
+                    path.append(child)
+                    pending.append(iter(self.get_children(child)))
+
+        self._subclass_closures = closures
+
+        return closures
+
+    def is_subclass(self, class_: CompiledClass, superclass: CompiledClass) -> bool:
+        """Whether the class is the superclass or descends from it through
+        `is_a`, in constant time."""
+
+        closure = self._get_subclass_closures()[superclass.name]
+
+        return bool(closure >> self._class_ids[class_.name] & 1)
+
+    def get_subclasses(self, class_: CompiledClass) -> tuple[CompiledClass, ...]:
+        """All descendants of the class through `is_a`, in schema order."""
+
+        closure = self._get_subclass_closures()[class_.name]
+        closure &= ~(1 << self._class_ids[class_.name])
+
+        subclasses = []
+        while closure:
+            lowest = closure & -closure
+            subclasses.append(self._classes_by_id[lowest.bit_length() - 1])
+            closure ^= lowest
+
+        return tuple(subclasses)
+
+    def count_subclasses(self, class_: CompiledClass) -> int:
+        """The number of descendants of the class through `is_a`."""
+
+        return self._get_subclass_closures()[class_.name].bit_count() - 1
+
+    def get_ancestors(self, class_: CompiledClass) -> tuple[CompiledClass, ...]:
+        """Superclasses of the class, starting with the nearest."""
+
+        if class_.name in self._ancestors:
+            return self._ancestors[class_.name]
+
+        # Walk up to the first class of which the chain is known, then fill
+        # in the chains on the way back down. This is iterative, so deep
+        # hierarchies do not hit the recursion limit.
+        path = []
+        current = class_
+        while current is not None and current.name not in self._ancestors:
+            if current in path:
+                raise _get_cycle_error(path, current)
+            path.append(current)
+            current = current.parent
+
+        if current is None:
+            ancestors = ()
+        else:
+            ancestors = (current, *self._ancestors[current.name])
+
+        for c in reversed(path):
+            self._ancestors[c.name] = ancestors
+            ancestors = (c, *ancestors)
+
+        return self._ancestors[class_.name]
+
+    def _get_bases(self, class_: CompiledClass) -> list[CompiledClass]:
+        """Mixins, then the superclass: the order in which they take precedence."""
+
+        bases = [self.classes[m] for m in class_.mixins if m in self.classes]
+        if class_.parent is not None:
+            bases.append(class_.parent)
+
+        return bases
+
+    def _resolve_bases_first[T](
+        self,
+        class_: CompiledClass,
+        resolved: dict[LinkMLClassName, T],
+        resolve: Callable[[CompiledClass], T],
+    ) -> T:
+        """Resolves the class after its bases, depth first, without recursing.
+
+        `resolve` is called once per class, when all its bases are in
+        `resolved`.
+        """
+
+        if class_.name in resolved:
+            return resolved[class_.name]
+
+        # The chain of classes being resolved, each waiting for its next
+        # unresolved base.
+        path = [class_]
+        pending = [iter(self._get_bases(class_))]
+        while path:
+            base = next((b for b in pending[-1] if b.name not in resolved), None)
+            if base is None:
+                current = path.pop()
+                pending.pop()
+                resolved[current.name] = resolve(current)
+            elif base in path:
+                raise _get_cycle_error(path, base)
+            else:
+                path.append(base)
+                pending.append(iter(self._get_bases(base)))
+
+        return resolved[class_.name]
+
+    def _linearize(self, class_: CompiledClass) -> tuple[CompiledClass, ...]:
+        bases = self._get_bases(class_)
+
+        if len(bases) <= 1:
+            # Single inheritance, the common case, needs no merging.
+            return (class_, *(self._mros[bases[0].name] if bases else ()))
+
+        return (
+            class_,
+            *_merge_linearizations(
+                class_, [list(self._mros[b.name]) for b in bases] + [bases]
+            ),
+        )
+
+    def get_mro(self, class_: CompiledClass) -> tuple[CompiledClass, ...]:
+        """The class, followed by its superclasses and mixins in method
+        resolution order (C3).
+
+        Mixins precede the superclass. Without mixins, this is the class
+        followed by its ancestors.
+        """
+
+        return self._resolve_bases_first(class_, self._mros, self._linearize)
+
+    def _induce_slots(self, class_: CompiledClass) -> dict[LinkMLSlotName, InducedSlot]:
+        induced = {}
+
+        # Declared by the class itself.
+        for slot in class_.attributes:
+            induced[slot.name] = (class_.name, slot)
+        for slot_name in class_.slots:
+            if slot_name not in induced and slot_name in self.slots:
+                induced[slot_name] = (class_.name, self.slots[slot_name])
+
+        # Inherited, unless overridden.
+        for base in self._get_bases(class_):
+            for slot_name, induced_slot in self._induced_slots[base.name].items():
+                induced.setdefault(slot_name, induced_slot)
+
+        for slot_usage in class_.slot_usage:
+            if slot_usage.name in induced:
+                owner, slot = induced[slot_usage.name]
+                induced[slot_usage.name] = (owner, _refine_slot(slot, slot_usage))
+
+        return induced
+
+    def get_induced_slots(self, class_: CompiledClass) -> tuple[InducedSlot, ...]:
+        """All slots of the class, own ones first, then inherited ones in the
+        order of the classes they are inherited from.
+
+        Own attributes and slots override inherited slots of the same name,
+        mixins override the superclass, and `slot_usage` refines the result.
+        Each class is resolved once, from the resolved slots of its bases.
+        """
+
+        self._resolve_bases_first(class_, self._induced_slots, self._induce_slots)
+
+        return tuple(self._induced_slots[class_.name].values())
+
+    def get_relation_graph(self) -> RelationGraph:
+        """The classes with their relations, inherited ones included, and
+        their superclasses, as a graph."""
+
+        if self._relation_graph is None:
+            self._relation_graph = build_relation_graph(
+                self.classes.values(),
+                lambda class_: (slot for _, slot in self.get_induced_slots(class_)),
+            )
+
+        return self._relation_graph
+
+
+def build_schema_index(
+    classes: dict[LinkMLClassName, CompiledClass],
+    slots: dict[LinkMLSlotName, CompiledSlot],
+) -> SchemaIndex:
+    """Indexes the classes in one pass. Their `parent` must be linked."""
+
+    children = {}
+    for class_ in classes.values():
+        if class_.parent is not None:
+            children.setdefault(class_.parent.name, []).append(class_)
+
+    return SchemaIndex(
+        classes=classes,
+        slots=slots,
+        children={name: tuple(subclasses) for name, subclasses in children.items()},
+    )
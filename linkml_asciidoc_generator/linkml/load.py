@@ -0,0 +1,226 @@
+import logging
+import time
+from pathlib import Path
+from typing import Iterable
+
+from linkml_asciidoc_generator.config import Config
+from linkml_asciidoc_generator.linkml.model import (
+    LinkMLElementName,
+    LinkMLSchema,
+    Metamodel,
+)
+from linkml_asciidoc_generator.linkml.read import (
+    is_linkml_schema_json,
+    read_linkml_schema,
+)
+from linkml_asciidoc_generator.linkml.parse import (
+    ParseMode,
+    parse_linkml_schema,
+    parse_linkml_schema_json,
+)
+from linkml_asciidoc_generator.linkml.fragments import (
+    get_linkml_schema_fragments,
+    parse_linkml_schema_fragments,
+)
+from linkml_asciidoc_generator.linkml.source_index import (
+    SchemaSourceIndex,
+    index_linkml_schema_source,
+    read_linkml_schema_subset,
+)
+from linkml_asciidoc_generator.linkml.imports import (
+    merge_linkml_schemas,
+    resolve_linkml_import,
+)
+from linkml_asciidoc_generator.linkml.cache import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_MAX_CACHE_SIZE,
+    CacheKey,
+    get_cache_key,
+    read_cached_linkml_schema,
+    write_cached_linkml_schema,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Schemas loaded by this process, by path and content address, so schemas
+# imported by many others are only read and parsed once.
+_loaded_schemas: dict[tuple[Path, CacheKey], LinkMLSchema] = {}
+
+_source_indexes: dict[Path, SchemaSourceIndex] = {}
+
+
+def _parse_linkml_schema_file(schema_file: Path, config: Config) -> LinkMLSchema:
+    mode = config.get("parse_mode", ParseMode.STRICT)
+    metamodel = config.get("metamodel", Metamodel.PROJECTION)
+
+    if schema_file.is_dir():
+        return parse_linkml_schema_fragments(schema_file, mode, metamodel)
+
+    # JSON goes straight to pydantic-core, without a dictionary in between.
+    if is_linkml_schema_json(schema_file):
+        return parse_linkml_schema_json(schema_file.read_bytes(), mode, metamodel)
+
+    schema_dict = read_linkml_schema(schema_file)
+    schema = parse_linkml_schema(schema_dict, mode, metamodel)
+
+    return schema
+
+
+def _read_schema_bytes(schema_file: Path) -> bytes:
+    if not schema_file.is_dir():
+        return schema_file.read_bytes()
+
+    # Fragment names are part of the content: they decide the order.
+    return b"\0".join(
+        f"{fragment_file.name}\0".encode("utf8") + fragment_file.read_bytes()
+        for fragment_file in get_linkml_schema_fragments(schema_file)
+    )
+
+
+def _load_linkml_schema(schema_file: Path, config: Config) -> LinkMLSchema:
+    """Loads the schema itself, without its imports."""
+
+    cache_config = config.get("cache", {})
+    start = time.perf_counter()
+
+    key = get_cache_key(
+        _read_schema_bytes(schema_file),
+        config.get("parse_mode", ParseMode.STRICT).value,
+        config.get("metamodel", Metamodel.PROJECTION).value,
+    )
+    loaded_key = (schema_file.resolve(), key)
+
+    if loaded_key in _loaded_schemas:
+        return _loaded_schemas[loaded_key]
+
+    if not cache_config.get("enabled", True):
+        schema = _parse_linkml_schema_file(schema_file, config)
+        _loaded_schemas[loaded_key] = schema
+        return schema
+
+    cache_dir = Path(cache_config.get("dir", DEFAULT_CACHE_DIR))
+
+    schema = read_cached_linkml_schema(key, cache_dir)
+    if schema is not None:
+        logger.info(
+            "Loaded %s from cache in %.3f s",
+            schema_file,
+            time.perf_counter() - start,
+        )
+    else:
+        schema = _parse_linkml_schema_file(schema_file, config)
+        write_cached_linkml_schema(
+            key,
+            schema,
+            cache_dir,
+            cache_config.get("max_size", DEFAULT_MAX_CACHE_SIZE),
+        )
+
+    _loaded_schemas[loaded_key] = schema
+
+    return schema
+
+
+def _load_linkml_imports(
+    schema: LinkMLSchema, schema_file: Path, config: Config, seen: set[Path]
+) -> LinkMLSchema:
+    search_paths = config.get("imports", {}).get("search_paths", [])
+    # Imports are relative to the schema file, or to the directory that holds
+    # the fragments of a schema.
+    base_dir = schema_file if schema_file.is_dir() else schema_file.parent
+
+    imported_schemas = []
+    for import_name in schema.imports or []:
+        import_file = resolve_linkml_import(import_name, base_dir, search_paths)
+        if import_file is None:
+            logger.warning(
+                "Could not resolve import %r of %s; skipping it",
+                import_name,
+                schema_file,
+            )
+            continue
+
+        if import_file.resolve() in seen:
+            continue
+        seen.add(import_file.resolve())
+
+        imported_schema = _load_linkml_schema(import_file, config)
+        imported_schemas.append(
+            _load_linkml_imports(imported_schema, import_file, config, seen)
+        )
+
+    return merge_linkml_schemas(schema, imported_schemas)
+
+
+def load_linkml_schema(schema_file: Path, config: Config) -> LinkMLSchema:
+    """Reads and parses the schema, going through the parsed-schema cache.
+
+    The schema is either a file, or a directory of fragments of a schema.
+
+    The cache is enabled unless `config["cache"]["enabled"]` is false.
+    Imports are resolved from local files and merged into the schema unless
+    `config["imports"]["resolve"]` is false.
+    """
+
+    schema = _load_linkml_schema(schema_file, config)
+
+    if config.get("imports", {}).get("resolve", True):
+        schema = _load_linkml_imports(
+            schema, schema_file, config, seen={schema_file.resolve()}
+        )
+
+    return schema
+
+
+def _get_source_index(schema_file: Path) -> SchemaSourceIndex:
+    source_index = _source_indexes.get(schema_file.resolve())
+
+    if source_index is None or source_index.is_stale():
+        source_index = index_linkml_schema_source(schema_file)
+        _source_indexes[schema_file.resolve()] = source_index
+
+    return source_index
+
+
+def load_linkml_schema_subset(
+    schema_file: Path, names: Iterable[LinkMLElementName], config: Config
+) -> LinkMLSchema:
+    """Reads and parses only the parts of the schema that the pages of the
+    named classes and enums need.
+
+    The YAML is read through an index of the file, which is kept for the
+    lifetime of the process. The parsed-schema cache is not used.
+    """
+
+    source_index = _get_source_index(schema_file)
+    diagrams = config.get("diagrams", {})
+    start = time.perf_counter()
+
+    schema = parse_linkml_schema(
+        read_linkml_schema_subset(
+            source_index,
+            names,
+            polymorphic_used_by=config.get("used_by", {}).get("polymorphic", False),
+            hierarchy_depth=config.get("class_hierarchy", {}).get("depth", 1),
+            relation_hops=(
+                diagrams.get("relation_hops", 1) if diagrams.get("relations") else 1
+            ),
+        ),
+        config.get("parse_mode", ParseMode.STRICT),
+        config.get("metamodel", Metamodel.PROJECTION),
+    )
+    logger.info(
+        "Loaded %d classes and %d enums of %s in %.3f s",
+        len(schema.classes or {}),
+        len(schema.enums or {}),
+        schema_file,
+        time.perf_counter() - start,
+    )
+
+    if config.get("imports", {}).get("resolve", True):
+        schema = _load_linkml_imports(
+            schema, schema_file, config, seen={schema_file.resolve()}
+        )
+
+    return schema
@@ -10,6 +10,16 @@ from linkml_asciidoc_generator.linkml.model.metamodel import (
     SchemaDefinition,
     PermissibleValue,
 )
+from linkml_asciidoc_generator.linkml.model import projection
+from linkml_asciidoc_generator.linkml.model.compiled import (
+    CompiledElement as CompiledElement,
+    CompiledClass as CompiledClass,
+    CompiledEnum as CompiledEnum,
+    CompiledPermissibleValue as CompiledPermissibleValue,
+    CompiledType as CompiledType,
+    CompiledSlot as CompiledSlot,
+    CompiledSchema as CompiledSchema,
+)
 
 LinkMLElement = Element
 LinkMLClass = ClassDefinition
@@ -22,6 +32,23 @@ LinkMLAttribute = NewType("LinkMLAttribute", LinkMLSlot)
 
 LinkMLSchema = SchemaDefinition
 
+
+class Metamodel(Enum):
+    """Which metamodel a schema is validated into.
+
+    The projection only covers the fields the generator reads; the full
+    metamodel is there for custom code that needs anything else.
+    """
+
+    PROJECTION = "projection"
+    FULL = "full"
+
+
+LINKML_SCHEMA_TYPES: dict[Metamodel, type[LinkMLSchema]] = {
+    Metamodel.PROJECTION: projection.SchemaDefinition,
+    Metamodel.FULL: SchemaDefinition,
+}
+
 LinkMLElementName = str
 LinkMLSlotName = str
 LinkMLClassName = str
@@ -0,0 +1,105 @@
+"""Compact, immutable representation of a parsed schema.
+
+The records are built once from the parsed schema by `compile_linkml_schema`
+and are what the query and generation layers work on. Field names follow
+the metamodel, with the element name stored on the record itself and with
+direct references to the parent class (`parent`) and to the element a slot
+range refers to (`range_element`). The schema carries an index of its
+classes, for lookups that would otherwise scan all of them, a registry of
+what each range name resolves to, and a table of its slots, with what
+generation derives from them computed in bulk.
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from linkml_asciidoc_generator.linkml.index import SchemaIndex
+    from linkml_asciidoc_generator.linkml.ranges import RangeRegistry
+    from linkml_asciidoc_generator.linkml.slot_table import SlotTable
+
+
+type CURIE = str
+type Name = str
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledElement:
+    name: Name
+    title: str | None = None
+    description: str | None = None
+    from_schema: str | None = None
+    see_also: tuple[str, ...] | None = None
+    mappings: tuple[CURIE, ...] | None = None
+    exact_mappings: tuple[CURIE, ...] | None = None
+    close_mappings: tuple[CURIE, ...] | None = None
+    narrow_mappings: tuple[CURIE, ...] | None = None
+    broad_mappings: tuple[CURIE, ...] | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledType(CompiledElement):
+    uri: CURIE | None = None
+    typeof: Name | None = None
+    parent: "CompiledType | None" = None
+    base: str | None = None
+    repr: str | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledPermissibleValue:
+    text: str
+    description: str | None = None
+    meaning: CURIE | None = None
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledEnum(CompiledElement):
+    enum_uri: CURIE | None = None
+    permissible_values: tuple[CompiledPermissibleValue, ...] = ()
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledSlot(CompiledElement):
+    slot_uri: CURIE | None = None
+    is_a: Name | None = None
+    range: Name | None = None
+    range_element: "CompiledClass | CompiledEnum | CompiledType | None" = None
+    required: bool | None = None
+    multivalued: bool | None = None
+    identifier: bool | None = None
+    owner: "CompiledClass | None" = None  # `None` for schema-level slots.
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True)
+class CompiledClass(CompiledElement):
+    class_uri: CURIE | None = None
+    is_a: Name | None = None
+    parent: "CompiledClass | None" = None
+    mixins: tuple[Name, ...] = ()
+    abstract: bool = False
+    mixin: bool = False
+    tree_root: bool = False
+    attributes: tuple[CompiledSlot, ...] = ()
+    slots: tuple[Name, ...] = ()
+    slot_usage: tuple[CompiledSlot, ...] = ()
+
+
+@dataclass(frozen=True, slots=True, eq=False, kw_only=True, weakref_slot=True)
+class CompiledSchema:
+    id: str
+    name: Name
+    title: str | None = None
+    description: str | None = None
+    version: str | None = None
+    imports: tuple[str, ...] = ()
+    prefixes: dict[str, str]
+    default_prefix: str | None = None
+    default_range: Name | None = None
+    classes: dict[Name, CompiledClass]
+    slots: dict[Name, CompiledSlot]
+    enums: dict[Name, CompiledEnum]
+    types: dict[Name, CompiledType]
+    index: "SchemaIndex | None" = None
+    ranges: "RangeRegistry | None" = None
+    slot_table: "SlotTable | None" = None
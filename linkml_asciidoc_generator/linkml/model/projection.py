@@ -0,0 +1,86 @@
+"""Projection of the LinkML metamodel onto the fields the generator reads.
+
+The classes mirror their namesakes in `metamodel`, but only declare the
+fields used to generate the documentation. Everything else in the schema
+is ignored while validating, which makes parsing large schemas cheaper in
+both time and memory. Use the full metamodel when other fields are needed.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional
+
+from linkml_asciidoc_generator.linkml.model.metamodel import ConfiguredBaseModel
+
+
+class Element(ConfiguredBaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    from_schema: Optional[str] = None
+    see_also: Optional[List[str]] = None
+    mappings: Optional[List[str]] = None
+    exact_mappings: Optional[List[str]] = None
+    close_mappings: Optional[List[str]] = None
+    narrow_mappings: Optional[List[str]] = None
+    broad_mappings: Optional[List[str]] = None
+
+
+class Definition(Element):
+    is_a: Optional[str] = None
+    mixins: Optional[List[str]] = None
+    abstract: Optional[bool] = None
+    mixin: Optional[bool] = None
+
+
+class SubsetDefinition(Element):
+    pass
+
+
+class TypeDefinition(Element):
+    typeof: Optional[str] = None
+    base: Optional[str] = None
+    uri: Optional[str] = None
+    repr: Optional[str] = None
+
+
+class PermissibleValue(ConfiguredBaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    meaning: Optional[str] = None
+
+
+class EnumDefinition(Definition):
+    enum_uri: Optional[str] = None
+    permissible_values: Optional[Dict[str, PermissibleValue]] = None
+
+
+class SlotDefinition(Definition):
+    slot_uri: Optional[str] = None
+    range: Optional[str] = None
+    required: Optional[bool] = None
+    multivalued: Optional[bool] = None
+    identifier: Optional[bool] = None
+
+
+class ClassDefinition(Definition):
+    class_uri: Optional[str] = None
+    tree_root: Optional[bool] = None
+    slots: Optional[List[str]] = None
+    slot_usage: Optional[Dict[str, SlotDefinition]] = None
+    attributes: Optional[Dict[str, SlotDefinition]] = None
+
+
+class SchemaDefinition(Element):
+    id: str
+    name: str
+    version: Optional[str] = None
+    license: Optional[str] = None
+    imports: Optional[List[str]] = None
+    prefixes: Optional[Dict[str, str]] = None
+    default_prefix: Optional[str] = None
+    default_range: Optional[str] = None
+    subsets: Optional[Dict[str, SubsetDefinition]] = None
+    types: Optional[Dict[str, TypeDefinition]] = None
+    enums: Optional[Dict[str, EnumDefinition]] = None
+    slots: Optional[Dict[str, SlotDefinition]] = None
+    classes: Optional[Dict[str, ClassDefinition]] = None
@@ -1,4 +1,218 @@
-from linkml_asciidoc_generator.linkml.model import LinkMLSchema
+import json
+import sys
+from enum import Enum
+from functools import cache
+from types import NoneType, UnionType
+from typing import Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+from linkml_asciidoc_generator.linkml.model import (
+    LINKML_SCHEMA_TYPES,
+    LinkMLSchema,
+    Metamodel,
+)
+
+
+class ParseMode(Enum):
+    """How a schema is turned into the metamodel.
+
+    `TRUSTED` only skips validation for the full metamodel. Validating into
+    the projection in pydantic-core is as fast as building it without
+    validation in Python, so with the projection it parses like `STRICT`.
+    """
+
+    STRICT = "strict"
+    TRUSTED = "trusted"
+
+
+def _get_model_type(annotation) -> type[BaseModel] | None:
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+
+    if get_origin(annotation) in (Union, UnionType):
+        for arg in get_args(annotation):
+            if arg is not NoneType and (model_type := _get_model_type(arg)):
+                return model_type
+
+    return None
+
+
+@cache
+def _get_nested_fields(
+    model_type: type[BaseModel],
+) -> dict[str, tuple[type | None, type[BaseModel]]]:
+    """Fields of the model that hold (containers of) other models.
+
+    Maps field names to the container type (`dict`, `list` or `None` for
+    a bare model) and the model type.
+    """
+
+    nested_fields = {}
+
+    for field_name, field in model_type.model_fields.items():
+        annotation = field.annotation
+
+        # Unwrap `Optional[...]`.
+        if get_origin(annotation) in (Union, UnionType):
+            args = [arg for arg in get_args(annotation) if arg is not NoneType]
+            if len(args) == 1:
+                annotation = args[0]
+
+        container_type = get_origin(annotation)
+        if container_type in (dict, list):
+            model_type_ = _get_model_type(get_args(annotation)[-1])
+        else:
+            container_type = None
+            model_type_ = _get_model_type(annotation)
+
+        if model_type_ is not None:
+            nested_fields[field_name] = (container_type, model_type_)
+
+    return nested_fields
+
+
+@cache
+def _get_defaults(model_type: type[BaseModel]) -> tuple[dict, dict]:
+    """Static defaults and default factories of the model's optional fields."""
+
+    defaults, default_factories = {}, {}
+
+    for field_name, field in model_type.model_fields.items():
+        if field.default_factory is not None:
+            default_factories[field_name] = field.default_factory
+        elif not field.is_required():
+            defaults[field_name] = field.default
+
+    return defaults, default_factories
+
+
+def _construct[T: BaseModel](model_type: type[T], data: dict) -> T:
+    """Builds the model tree without validating any of it.
+
+    This does what `BaseModel.model_construct` does, minus the per-instance
+    bookkeeping that makes it slower than validating in pydantic-core.
+    """
+
+    fields = model_type.model_fields
+    nested_fields = _get_nested_fields(model_type)
+
+    values = {}
+    for field_name, value in data.items():
+        if field_name not in fields:
+            continue
+
+        nested = nested_fields.get(field_name)
+
+        if nested is None or value is None:
+            values[field_name] = value
+            continue
+
+        container_type, nested_model_type = nested
+        if container_type is dict and isinstance(value, dict):
+            value = {
+                k: _construct(nested_model_type, v) if isinstance(v, dict) else v
+                for k, v in value.items()
+            }
+        elif container_type is list and isinstance(value, list):
+            value = [
+                _construct(nested_model_type, v) if isinstance(v, dict) else v
+                for v in value
+            ]
+        elif container_type is None and isinstance(value, dict):
+            value = _construct(nested_model_type, value)
+
+        values[field_name] = value
+
+    defaults, default_factories = _get_defaults(model_type)
+    instance_dict = defaults.copy()
+    for field_name, default_factory in default_factories.items():
+        instance_dict[field_name] = default_factory()
+    instance_dict.update(values)
+
+    instance = model_type.__new__(model_type)
+    object.__setattr__(instance, "__dict__", instance_dict)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(
+        instance,
+        "__pydantic_private__",
+        {
+            name: private_attr.get_default(call_default_factory=True)
+            for name, private_attr in model_type.__private_attributes__.items()
+        },
+    )
+
+    return instance
+
+
+# Fields of which the values recur throughout a schema: references to other
+# elements, by name, and the schema they are from. Their strings are
+# interned, like the element names, so each distinct value is held once and
+# comparing a reference with a name is an identity check. URIs such as
+# `slot_uri` are unique per element, so interning them would only grow the
+# interned strings table.
+INTERNED_FIELDS = ("from_schema", "is_a", "range", "typeof")
+INTERNED_LIST_FIELDS = ("mixins", "slots")
+
+
+def _intern_names[T](elements: dict[str, T] | None) -> dict[str, T] | None:
+    if elements is None:
+        return None
+
+    return {sys.intern(name): el for name, el in elements.items()}
+
+
+def _intern_fields(el: BaseModel) -> None:
+    # Written to `__dict__` directly: assignment would validate again.
+    values = el.__dict__
+
+    for field_name in INTERNED_FIELDS:
+        value = values.get(field_name)
+        if type(value) is str:
+            values[field_name] = sys.intern(value)
+
+    for field_name in INTERNED_LIST_FIELDS:
+        value = values.get(field_name)
+        if value:
+            values[field_name] = [
+                sys.intern(v) if type(v) is str else v for v in value
+            ]
+
+
+def intern_schema_strings(schema: LinkMLSchema) -> None:
+    """Interns the element names of the parsed schema and the references to
+    them, in place.
+
+    Parsing does this already. Call it again for a schema of which the
+    strings were copied, such as one put together from parts parsed in
+    other processes.
+    """
+
+    values = schema.__dict__
+
+    for field_name in ("classes", "slots", "types", "enums", "subsets", "prefixes"):
+        values[field_name] = _intern_names(values.get(field_name))
+
+    for el in (
+        *(schema.slots or {}).values(),
+        *(schema.types or {}).values(),
+        *(schema.enums or {}).values(),
+    ):
+        _intern_fields(el)
+
+    for class_ in (schema.classes or {}).values():
+        _intern_fields(class_)
+
+        class_values = class_.__dict__
+        for field_name in ("attributes", "slot_usage"):
+            slots = class_values[field_name] = _intern_names(class_values.get(field_name))
+            for slot in (slots or {}).values():
+                if isinstance(slot, BaseModel):
+                    _intern_fields(slot)
+
+    if schema.default_range is not None:
+        values["default_range"] = sys.intern(schema.default_range)
 
 
 def _set_names(elements) -> None:
@@ -6,8 +220,8 @@ def _set_names(elements) -> None:
         el._meta["name"] = name
 
 
-def parse_linkml_schema(schema_dict: dict) -> LinkMLSchema:
-    schema = LinkMLSchema.model_validate(schema_dict)
+def _set_schema_names(schema: LinkMLSchema) -> None:
+    intern_schema_strings(schema)
 
     # Set name for elements.
     _set_names(schema.classes or {})
@@ -21,4 +235,50 @@ def parse_linkml_schema(schema_dict: dict) -> LinkMLSchema:
         _set_names(class_.attributes or {})
         _set_names(class_.slot_usage or {})
 
+
+def parse_linkml_schema(
+    schema_dict: dict,
+    mode: ParseMode = ParseMode.STRICT,
+    metamodel: Metamodel = Metamodel.PROJECTION,
+) -> LinkMLSchema:
+    """Parses the schema dictionary into the LinkML metamodel.
+
+    Use `ParseMode.TRUSTED` only for schemas that were already validated
+    upstream: with the full metamodel it skips all validation and coercion.
+    """
+
+    schema_type = LINKML_SCHEMA_TYPES[metamodel]
+
+    match mode:
+        case ParseMode.TRUSTED if metamodel is Metamodel.FULL:
+            schema = _construct(schema_type, schema_dict)
+        case _:
+            schema = schema_type.model_validate(schema_dict)
+
+    _set_schema_names(schema)
+
+    return schema
+
+
+def parse_linkml_schema_json(
+    schema_json: bytes | str,
+    mode: ParseMode = ParseMode.STRICT,
+    metamodel: Metamodel = Metamodel.PROJECTION,
+) -> LinkMLSchema:
+    """Parses the schema JSON document into the LinkML metamodel.
+
+    In strict mode pydantic-core parses and validates the document in one
+    pass, without building a dictionary of it first.
+    """
+
+    schema_type = LINKML_SCHEMA_TYPES[metamodel]
+
+    match mode:
+        case ParseMode.TRUSTED if metamodel is Metamodel.FULL:
+            schema = _construct(schema_type, json.loads(schema_json))
+        case _:
+            schema = schema_type.model_validate_json(schema_json)
+
+    _set_schema_names(schema)
+
     return schema
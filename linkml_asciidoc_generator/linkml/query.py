@@ -1,127 +1,262 @@
+from operator import attrgetter
+from typing import Iterable
+
 from linkml_asciidoc_generator.linkml.model import (
-    LinkMLClass,
-    LinkMLSchema,
-    LinkMLSlot,
+    CompiledClass,
+    CompiledSchema,
+    CompiledSlot,
     LinkMLClassName,
-    LinkMLSlotOwner,
+    LinkMLElementName,
+)
+from linkml_asciidoc_generator.linkml.ranges import RangeKind
+from linkml_asciidoc_generator.linkml.relation_graph import (
+    ALL_EDGES,
+    Direction,
+    EdgeKind,
+    RelationEdge,
 )
 
 
-def get_class(name: LinkMLClassName, schema: LinkMLSchema) -> LinkMLClass | None:
-    if schema.classes is None or name not in schema.classes:
-        return None
+def get_class(name: LinkMLClassName, schema: CompiledSchema) -> CompiledClass | None:
+    return schema.classes.get(name)
 
-    return schema.classes[name]
 
+def get_superclass(
+    class_: CompiledClass, schema: CompiledSchema
+) -> CompiledClass | None:
+    return class_.parent
 
-def get_superclass(class_: LinkMLClass, schema: LinkMLSchema) -> LinkMLClass | None:
-    return get_class(class_.is_a, schema)
 
+def get_descendants(
+    class_: CompiledClass, schema: CompiledSchema, include_indirect: bool = False
+) -> list[CompiledClass]:
+    """Subclasses of the given class: the direct ones, or with
+    `include_indirect` all of them, in schema order."""
 
-def get_descendants(class_: LinkMLClass, schema: LinkMLSchema) -> list[LinkMLClass]:
-    return list(
-        filter(lambda c: c.is_a == class_._meta["name"], schema.classes.values())
-    )
+    if include_indirect:
+        return list(schema.index.get_subclasses(class_))
+
+    return list(schema.index.get_children(class_))
+
+
+def is_subclass(
+    class_: CompiledClass, superclass: CompiledClass, schema: CompiledSchema
+) -> bool:
+    """Checks whether the class is the superclass or one of its descendants."""
+
+    return schema.index.is_subclass(class_, superclass)
+
+
+def get_subclass_tree(
+    class_: CompiledClass, schema: CompiledSchema, max_depth: int | None = None
+) -> list[tuple[CompiledClass, int]]:
+    """Descendants of the given class, each with its depth below it, depth
+    first with siblings sorted by name.
+
+    Descendants deeper than `max_depth` are left out.
+    """
+
+    def _get_sorted_children(c: CompiledClass, depth: int):
+        # Reversed, to be popped in order.
+        return [
+            (child, depth)
+            for child in sorted(schema.index.get_children(c), key=attrgetter("name"), reverse=True)
+        ]
+
+    tree = []
+    pending = _get_sorted_children(class_, 1)
+    while pending:
+        subclass, depth = pending.pop()
+        tree.append((subclass, depth))
+
+        # The subclass closure also rules out cycles.
+        if (max_depth is None or depth < max_depth) and schema.index.count_subclasses(subclass):
+            pending.extend(_get_sorted_children(subclass, depth + 1))
 
+    return tree
 
-def get_ancestors(class_: LinkMLClass, schema: LinkMLSchema) -> list[LinkMLClass]:
+
+def get_ancestors(class_: CompiledClass, schema: CompiledSchema) -> list[CompiledClass]:
     """Superclasses of the given class.
 
     The list of superclasses is ordered starting with the nearest.
     """
 
-    superclass = get_superclass(class_, schema)
+    return list(schema.index.get_ancestors(class_))
 
-    if superclass is None:
-        return []
-    else:
-        return [superclass] + get_ancestors(superclass, schema)
 
+def get_mro(class_: CompiledClass, schema: CompiledSchema) -> list[CompiledClass]:
+    """Superclasses and mixins of the given class, in method resolution order.
+
+    Unlike with Python's `__mro__`, the class itself is not included.
+    """
 
-def is_relation(slot: LinkMLSlot, schema: LinkMLSchema) -> bool:
+    return list(schema.index.get_mro(class_)[1:])
+
+
+def is_relation(slot: CompiledSlot, schema: CompiledSchema) -> bool:
     """Checks whether the given slot is a relationship or not."""
 
-    return slot.range in schema.classes
+    return schema.slot_table.is_relation(slot)
 
 
-def is_attribute(slot: LinkMLSlot, schema: LinkMLSchema) -> bool:
+def is_attribute(slot: CompiledSlot, schema: CompiledSchema) -> bool:
     """Checks whether the given slot is an attribute."""
 
     return not is_relation(slot, schema)
 
 
-def get_inherited_slots(
-    class_: LinkMLClass, schema: LinkMLSchema
-) -> dict[LinkMLSlotOwner, LinkMLSlot]:
-    slots = []
-    for ancestor in get_ancestors(class_, schema):
-        if not ancestor.attributes:
-            continue
+def get_induced_slots(
+    class_: CompiledClass,
+    schema: CompiledSchema,
+    include_inherited: bool = True,
+) -> list[tuple[LinkMLClassName, CompiledSlot]]:
+    """Slots of the class, from `attributes` and `slots`, with inherited
+    ones (also from mixins) and `slot_usage` resolved.
 
-        ancestor_slots = list(ancestor.attributes.values())
-        slots.extend(
-            (ancestor._meta["name"], ancestor_slot) for ancestor_slot in ancestor_slots
-        )
+    Each slot is paired with the name of the class that declares it.
+    """
 
-    return slots
+    induced_slots = schema.index.get_induced_slots(class_)
 
+    if include_inherited:
+        return list(induced_slots)
+    else:
+        return [s for s in induced_slots if s[0] == class_.name]
 
-def get_relations(
-    class_: LinkMLClass,
-    schema: LinkMLSchema,
-    include_inherited: bool = True,
-    # ) -> dict[LinkMLSlotOwner, LinkMLSlot]:
-) -> list[tuple[LinkMLSlotOwner, LinkMLSlot]]:
-    # TODO: Expand this so that this also covers `slots` and `slot_usage` (if we allow that one as well).
-    class_name = class_._meta["name"]
-    _relations = []
-
-    if class_.attributes:
-        _relations.extend(
-            zip(
-                [class_name] * len(class_.attributes),
-                filter(lambda s: is_relation(s, schema), class_.attributes.values()),
-            )
-        )
 
-    if include_inherited:
-        _relations += list(
-            filter(
-                lambda s: is_relation(s[1], schema),
-                get_inherited_slots(class_, schema),
-            )
-        )
+def get_inherited_slots(
+    class_: CompiledClass, schema: CompiledSchema
+) -> list[tuple[LinkMLClassName, CompiledSlot]]:
+    return [
+        s for s in schema.index.get_induced_slots(class_) if s[0] != class_.name
+    ]
 
-    # TODO: Filter double _values_ from tuples
 
-    return _relations
+def get_relations(
+    class_: CompiledClass,
+    schema: CompiledSchema,
+    include_inherited: bool = True,
+) -> list[tuple[LinkMLClassName, CompiledSlot]]:
+    return [
+        s
+        for s in get_induced_slots(class_, schema, include_inherited)
+        if is_relation(s[1], schema)
+    ]
 
 
 def get_attributes(
-    class_: LinkMLClass,
-    schema: LinkMLSchema,
+    class_: CompiledClass,
+    schema: CompiledSchema,
     include_inherited: bool = True,
-) -> list[tuple[LinkMLSlotOwner, LinkMLSlot]]:
-    # TODO: Expand this so that this also covers `slots` and `slot_usage` (if we allow that one as well).
-    class_name = class_._meta["name"]
-    _attributes = []
-
-    if class_.attributes:
-        _attributes.extend(
-            zip(
-                [class_name] * len(class_.attributes),
-                filter(lambda s: is_attribute(s, schema), class_.attributes.values()),
-            )
-        )
+) -> list[tuple[LinkMLClassName, CompiledSlot]]:
+    return [
+        s
+        for s in get_induced_slots(class_, schema, include_inherited)
+        if is_attribute(s[1], schema)
+    ]
+
+
+def get_neighbourhood(
+    class_: CompiledClass,
+    schema: CompiledSchema,
+    hops: int = 1,
+    direction: Direction = Direction.OUT,
+    kinds: EdgeKind = ALL_EDGES,
+) -> dict[LinkMLClassName, int]:
+    """Classes at most `hops` relations or `is_a` edges away from the given
+    class, with their distance, nearest first.
+
+    The class itself is included, at distance 0.
+    """
 
-    if include_inherited:
-        _attributes += list(
-            filter(
-                lambda s: is_attribute(s[1], schema),
-                get_inherited_slots(class_, schema),
-            )
-        )
+    return schema.index.get_relation_graph().get_neighbourhood(
+        class_.name, hops, direction, kinds
+    )
 
-    # TODO: Filter double _values_ from tuples
 
-    return _attributes
+def get_neighbourhood_relations(
+    class_: CompiledClass, schema: CompiledSchema, hops: int = 1
+) -> list[RelationEdge]:
+    """Relations followed from the given class to the classes at most `hops`
+    relations away, as (source class, slot name, target class)."""
+
+    return schema.index.get_relation_graph().get_neighbourhood_edges(
+        class_.name, hops, Direction.OUT, EdgeKind.RELATION
+    )
+
+
+def is_reachable(
+    source: CompiledClass,
+    target: CompiledClass,
+    schema: CompiledSchema,
+    max_hops: int | None = None,
+    kinds: EdgeKind = ALL_EDGES,
+) -> bool:
+    """Checks whether the target class can be reached from the source class
+    by following relations (and `is_a` edges)."""
+
+    return schema.index.get_relation_graph().is_reachable(
+        source.name, target.name, max_hops, Direction.OUT, kinds
+    )
+
+
+def get_fan_out(class_: CompiledClass, schema: CompiledSchema) -> int:
+    """The number of relations of the class, inherited ones included."""
+
+    return schema.index.get_relation_graph().get_degree(
+        class_.name, Direction.OUT, EdgeKind.RELATION
+    )
+
+
+def get_fan_in(class_: CompiledClass, schema: CompiledSchema) -> int:
+    """The number of relations of all classes that have the class as range,
+    inherited ones included."""
+
+    return schema.index.get_relation_graph().get_degree(
+        class_.name, Direction.IN, EdgeKind.RELATION
+    )
+
+
+def get_reachable_elements(
+    seeds: Iterable[CompiledClass], schema: CompiledSchema
+) -> set[LinkMLElementName]:
+    """Names of the seed classes and of all classes reachable from them
+    through relations, superclasses and mixins, together with the enums and
+    custom types their slots have as range."""
+
+    graph = schema.index.get_relation_graph()
+
+    classes = set()
+    pending = [seed.name for seed in seeds]
+    while pending:
+        name = pending.pop()
+        if name in classes:
+            continue
+
+        classes.add(name)
+        pending.extend(graph.get_neighbourhood(name, 1))
+        pending.extend(c.name for c in schema.index.get_mro(schema.classes[name]))
+
+    elements = set(classes)
+    for name in classes:
+        for _, slot in schema.index.get_induced_slots(schema.classes[name]):
+            resolved = schema.ranges.resolve(slot.range)
+            if resolved is None or resolved.kind not in (RangeKind.ENUM, RangeKind.TYPE):
+                continue
+
+            elements.add(resolved.name)
+            if resolved.kind is RangeKind.ENUM:
+                continue
+
+            # Custom types link to the custom type they are a `typeof`.
+            typeof = resolved.element.typeof
+            while (
+                typeof is not None
+                and typeof not in elements
+                and schema.ranges.get_kind(typeof) is RangeKind.TYPE
+            ):
+                elements.add(typeof)
+                typeof = schema.types[typeof].typeof
+
+    return elements
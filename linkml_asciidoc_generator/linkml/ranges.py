@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledClass,
+    CompiledEnum,
+    CompiledType,
+    LinkMLClassName,
+    LinkMLElementName,
+    LinkMLPrimitive,
+)
+
+
+_PRIMITIVES = {primitive.value: primitive for primitive in LinkMLPrimitive}
+
+
+class RangeKind(Enum):
+    PRIMITIVE = "primitive"
+    TYPE = "type"  # A custom type, from `types`, that is not a primitive.
+    ENUM = "enum"
+    CLASS = "class"
+
+
+@dataclass(frozen=True, slots=True)
+class ResolvedRange:
+    name: LinkMLElementName
+    kind: RangeKind
+    element: CompiledClass | CompiledEnum | CompiledType | None = None
+    # For primitives and custom types: the primitive at the end of the
+    # `typeof` chain, if there is one.
+    primitive: LinkMLPrimitive | None = None
+
+
+@dataclass(frozen=True)
+class RangeRegistry:
+    """What every range name of a compiled schema refers to.
+
+    Names of LinkML primitives are primitives, also when the schema imports
+    them as types. Other types are custom types, resolved to the primitive
+    they are (indirectly) a `typeof`. Slots without a range have the schema's
+    `default_range`.
+    """
+
+    ranges: dict[LinkMLElementName, ResolvedRange]
+    default_range: ResolvedRange
+
+    def resolve(self, range_name: LinkMLElementName | None) -> ResolvedRange | None:
+        """The resolved range, or `None` for a name the schema does not
+        define."""
+
+        if range_name is None:
+            return self.default_range
+
+        return self.ranges.get(range_name)
+
+    def get_kind(self, range_name: LinkMLElementName | None) -> RangeKind | None:
+        resolved = self.resolve(range_name)
+
+        return None if resolved is None else resolved.kind
+
+    def get_custom_types(self) -> list[CompiledType]:
+        return [r.element for r in self.ranges.values() if r.kind is RangeKind.TYPE]
+
+
+def _get_base_primitive(
+    type_: CompiledType, types: dict[LinkMLElementName, CompiledType]
+) -> LinkMLPrimitive | None:
+    seen = set()
+    name = type_.typeof
+    while name is not None and name not in _PRIMITIVES and name not in seen:
+        seen.add(name)
+        name = types[name].typeof if name in types else None
+
+    return _PRIMITIVES.get(name)
+
+
+def build_range_registry(
+    types: dict[LinkMLElementName, CompiledType],
+    enums: dict[LinkMLElementName, CompiledEnum],
+    classes: dict[LinkMLClassName, CompiledClass],
+    default_range: LinkMLElementName | None = None,
+) -> RangeRegistry:
+    """Resolves every type, enum and class name once. Like slot ranges,
+    a class shadows an enum or type of the same name."""
+
+    ranges = {
+        name: ResolvedRange(name, RangeKind.PRIMITIVE, types.get(name), primitive)
+        for name, primitive in _PRIMITIVES.items()
+    }
+
+    for name, type_ in types.items():
+        if name not in _PRIMITIVES:
+            ranges[name] = ResolvedRange(
+                name, RangeKind.TYPE, type_, _get_base_primitive(type_, types)
+            )
+    for name, enum in enums.items():
+        ranges[name] = ResolvedRange(name, RangeKind.ENUM, enum)
+    for name, class_ in classes.items():
+        ranges[name] = ResolvedRange(name, RangeKind.CLASS, class_)
+
+    # Without a (known) `default_range`, fall back on `string`, like LinkML.
+    default = ranges.get(default_range) or ranges[LinkMLPrimitive.STRING.value]
+
+    return RangeRegistry(ranges=ranges, default_range=default)
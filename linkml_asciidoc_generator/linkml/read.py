@@ -1,9 +1,102 @@
+import json
+import logging
+import time
+from dataclasses import dataclass
+from enum import Enum
 from pathlib import Path
+
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml.
+    from yaml import SafeLoader as _SafeLoader
+
+
+logger = logging.getLogger(__name__)
+
+
+class YAMLLoader(Enum):
+    LIBYAML = "libyaml"
+    PYTHON = "python"
+
+
+JSON_SCHEMA_SUFFIX = ".json"
+
+
+YAML_LOADER = (
+    YAMLLoader.LIBYAML if _SafeLoader.__name__ == "CSafeLoader" else YAMLLoader.PYTHON
+)
+
+
+@dataclass(frozen=True)
+class SchemaReadStats:
+    schema_file: Path
+    loader: YAMLLoader
+    size: int
+    seconds: float
+
+
+def read_linkml_schema_with_stats(schema_file: Path) -> tuple[dict, SchemaReadStats]:
+    """Reads the YAML schema file, using libyaml when it is available.
+
+    Returns the schema dictionary together with which loader ran and how
+    long it took.
+    """
+
+    start = time.perf_counter()
 
-def read_linkml_schema(schema_file: Path) -> dict:
     with schema_file.open(mode="rb") as f:
-        schema_dict = yaml.safe_load(f)
+        schema_dict = yaml.load(f, Loader=_SafeLoader)
+        size = f.tell()
+
+    stats = SchemaReadStats(
+        schema_file=schema_file,
+        loader=YAML_LOADER,
+        size=size,
+        seconds=time.perf_counter() - start,
+    )
+    logger.info(
+        "Read %s (%d bytes) with %s loader in %.3f s",
+        stats.schema_file,
+        stats.size,
+        stats.loader.value,
+        stats.seconds,
+    )
+
+    return schema_dict, stats
+
+
+def read_linkml_schema_bytes(schema_bytes: bytes) -> dict:
+    """Reads YAML that is already in memory, e.g. part of a schema file."""
+
+    return yaml.load(schema_bytes, Loader=_SafeLoader)
+
+
+def read_linkml_schema(schema_file: Path) -> dict:
+    schema_dict, _ = read_linkml_schema_with_stats(schema_file)
 
     return schema_dict
+
+
+def is_linkml_schema_json(schema_file: Path) -> bool:
+    return schema_file.suffix == JSON_SCHEMA_SUFFIX
+
+
+def convert_linkml_schema_to_json(schema_file: Path, json_file: Path) -> None:
+    """Writes the YAML schema file as JSON, for `parse_linkml_schema_json`.
+
+    YAML values without a JSON counterpart, such as dates, are written as
+    their ISO 8601 strings.
+    """
+
+    schema_dict = read_linkml_schema(schema_file)
+
+    with json_file.open(mode="w", encoding="utf8") as f:
+        json.dump(
+            schema_dict,
+            f,
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=lambda value: value.isoformat(),
+        )
@@ -0,0 +1,228 @@
+from array import array
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from enum import Enum, IntFlag
+
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledClass,
+    CompiledSlot,
+    LinkMLClassName,
+    LinkMLSlotName,
+)
+
+
+class EdgeKind(IntFlag):
+    RELATION = 1  # A slot of the source class with the target class as range.
+    IS_A = 2  # The target class is the superclass of the source class.
+
+
+ALL_EDGES = EdgeKind.RELATION | EdgeKind.IS_A
+
+
+class Direction(Enum):
+    OUT = "out"
+    IN = "in"
+    BOTH = "both"
+
+
+# A relation between classes, as (source class, slot name, target class). The
+# slot name is `None` for `is_a` edges.
+type RelationEdge = tuple[LinkMLClassName, LinkMLSlotName | None, LinkMLClassName]
+
+
+@dataclass(frozen=True)
+class RelationGraph:
+    """The classes of a schema as nodes, with their relations and `is_a` as
+    edges, in compressed sparse row form.
+
+    Node `i` is the class `names[i]`. Its outgoing edges are
+    `out_offsets[i]` up to `out_offsets[i + 1]`, each with a target, a kind
+    and a label (the slot name). Incoming edges are indexed the same way
+    through `in_offsets` and `in_edges`, which hold edge numbers.
+    """
+
+    names: list[LinkMLClassName]
+    ids: dict[LinkMLClassName, int]
+    out_offsets: array
+    targets: array
+    sources: array
+    kinds: array
+    labels: list[LinkMLSlotName | None]
+    in_offsets: array
+    in_edges: array
+
+    def _get_edges(self, node: int, direction: Direction) -> Iterator[tuple[int, int]]:
+        """Edge numbers of the node, each with the node at its other end."""
+
+        if direction is not Direction.IN:
+            for edge in range(self.out_offsets[node], self.out_offsets[node + 1]):
+                yield edge, self.targets[edge]
+
+        if direction is not Direction.OUT:
+            for edge in self.in_edges[self.in_offsets[node] : self.in_offsets[node + 1]]:
+                yield edge, self.sources[edge]
+
+    def _walk(
+        self,
+        name: LinkMLClassName,
+        hops: int | None,
+        direction: Direction,
+        kinds: EdgeKind,
+    ) -> Iterator[tuple[int, int, int]]:
+        """Walks the graph breadth first, yielding every edge followed as
+        (distance of the node it leaves from, edge number, node it reaches).
+
+        Each node is expanded once; `hops` of `None` walks until nothing new
+        is reached.
+        """
+
+        # Plain ints: `&` on the flag itself is many times slower.
+        kinds = int(kinds)
+        start = self.ids[name]
+        seen = bytearray(len(self.names))
+        seen[start] = 1
+
+        frontier = [start]
+        distance = 0
+        while frontier and (hops is None or distance < hops):
+            next_frontier = []
+            for node in frontier:
+                for edge, neighbour in self._get_edges(node, direction):
+                    if not self.kinds[edge] & kinds:
+                        continue
+
+                    yield distance, edge, neighbour
+
+                    if not seen[neighbour]:
+                        seen[neighbour] = 1
+                        next_frontier.append(neighbour)
+
+            frontier = next_frontier
+            distance += 1
+
+    def get_neighbourhood(
+        self,
+        name: LinkMLClassName,
+        hops: int,
+        direction: Direction = Direction.OUT,
+        kinds: EdgeKind = ALL_EDGES,
+    ) -> dict[LinkMLClassName, int]:
+        """Classes at most `hops` edges away, with their distance, nearest
+        first. The class itself is at distance 0."""
+
+        neighbourhood = {name: 0}
+        for distance, _, neighbour in self._walk(name, hops, direction, kinds):
+            neighbourhood.setdefault(self.names[neighbour], distance + 1)
+
+        return neighbourhood
+
+    def get_neighbourhood_edges(
+        self,
+        name: LinkMLClassName,
+        hops: int,
+        direction: Direction = Direction.OUT,
+        kinds: EdgeKind = ALL_EDGES,
+    ) -> list[RelationEdge]:
+        """The edges followed to reach the neighbourhood, in the order they
+        were followed."""
+
+        return [
+            (self.names[self.sources[edge]], self.labels[edge], self.names[self.targets[edge]])
+            for _, edge, _ in self._walk(name, hops, direction, kinds)
+        ]
+
+    def is_reachable(
+        self,
+        source: LinkMLClassName,
+        target: LinkMLClassName,
+        max_hops: int | None = None,
+        direction: Direction = Direction.OUT,
+        kinds: EdgeKind = ALL_EDGES,
+    ) -> bool:
+        if source == target:
+            return True
+
+        target_id = self.ids[target]
+
+        return any(
+            neighbour == target_id
+            for _, _, neighbour in self._walk(source, max_hops, direction, kinds)
+        )
+
+    def get_degree(
+        self,
+        name: LinkMLClassName,
+        direction: Direction = Direction.OUT,
+        kinds: EdgeKind = ALL_EDGES,
+    ) -> int:
+        """The number of edges of the given kinds that leave (`OUT`), enter
+        (`IN`) or touch (`BOTH`) the class."""
+
+        kinds = int(kinds)
+
+        return sum(
+            1
+            for edge, _ in self._get_edges(self.ids[name], direction)
+            if self.kinds[edge] & kinds
+        )
+
+
+def build_relation_graph(
+    classes: Iterable[CompiledClass],
+    get_slots: Callable[[CompiledClass], Iterable[CompiledSlot]],
+) -> RelationGraph:
+    """Packs the classes and the relations returned by `get_slots` for each
+    of them into a graph. Ranges and superclasses outside `classes` are left
+    out."""
+
+    classes = list(classes)
+    names = [class_.name for class_ in classes]
+    ids = {name: node for node, name in enumerate(names)}
+
+    out_offsets = array("l", [0])
+    targets = array("l")
+    sources = array("l")
+    kinds = array("b")
+    labels = []
+
+    def add_edge(source: int, target: int, kind: EdgeKind, label) -> None:
+        sources.append(source)
+        targets.append(target)
+        kinds.append(kind)
+        labels.append(label)
+
+    for node, class_ in enumerate(classes):
+        for slot in get_slots(class_):
+            range_element = slot.range_element
+            if isinstance(range_element, CompiledClass) and range_element.name in ids:
+                add_edge(node, ids[range_element.name], EdgeKind.RELATION, slot.name)
+
+        if class_.parent is not None and class_.parent.name in ids:
+            add_edge(node, ids[class_.parent.name], EdgeKind.IS_A, None)
+
+        out_offsets.append(len(targets))
+
+    # Incoming edges, grouped by target with a counting sort.
+    in_offsets = array("l", [0]) * (len(names) + 1)
+    for target in targets:
+        in_offsets[target + 1] += 1
+    for node in range(len(names)):
+        in_offsets[node + 1] += in_offsets[node]
+
+    in_edges = array("l", [0]) * len(targets)
+    next_in_edge = in_offsets[:-1]
+    for edge, target in enumerate(targets):
+        in_edges[next_in_edge[target]] = edge
+        next_in_edge[target] += 1
+
+    return RelationGraph(
+        names=names,
+        ids=ids,
+        out_offsets=out_offsets,
+        targets=targets,
+        sources=sources,
+        kinds=kinds,
+        labels=labels,
+        in_offsets=in_offsets,
+        in_edges=in_edges,
+    )
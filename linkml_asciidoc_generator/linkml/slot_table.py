@@ -0,0 +1,175 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from linkml_asciidoc_generator.linkml.model import (
+    CompiledClass,
+    CompiledSlot,
+    LinkMLClassName,
+    LinkMLElementName,
+    LinkMLPrimitive,
+)
+from linkml_asciidoc_generator.linkml.ranges import RangeKind, RangeRegistry
+
+
+# Stands for `None` in the integer columns.
+NONE = -1
+
+# Maximum cardinality of a multivalued slot.
+UNBOUNDED = -1
+
+
+def _get_flag(value: bool | None) -> int:
+    return NONE if value is None else int(value)
+
+
+def _get_min_cardinality(required: int) -> int:
+    # `required` may also be a number; it is the minimum then.
+    return 0 if required == NONE else required
+
+
+def _get_max_cardinality(multivalued: int) -> int:
+    return UNBOUNDED if multivalued == 1 else 1
+
+
+@dataclass
+class SlotTable:
+    """The slot definitions of a compiled schema, one row per slot, stored
+    by column.
+
+    The input columns are the owner, the range and the `required` and
+    `multivalued` flags. Classification as relation, cardinalities and data
+    types are derived from them for all rows at once, and per distinct
+    range rather than per slot where they only depend on the range.
+
+    All rows are added when the table is built, refined slots included, so
+    lookups never change the table and it can be shared as is.
+    """
+
+    ranges: RangeRegistry
+    class_names: list[LinkMLClassName] = field(default_factory=list)
+    range_names: list[LinkMLElementName | None] = field(default_factory=list)
+    rows: dict[CompiledSlot, int] = field(default_factory=dict, repr=False)
+
+    # Input columns, by row.
+    owners: array = field(default_factory=lambda: array("l"), repr=False)
+    range_ids: array = field(default_factory=lambda: array("l"), repr=False)
+    required: array = field(default_factory=lambda: array("l"), repr=False)
+    multivalued: array = field(default_factory=lambda: array("b"), repr=False)
+
+    # Derived columns, by row.
+    relations: array = field(default_factory=lambda: array("b"), repr=False)
+    min_cardinalities: array = field(default_factory=lambda: array("l"), repr=False)
+    max_cardinalities: array = field(default_factory=lambda: array("l"), repr=False)
+
+    # Derived columns, by range id.
+    range_is_class: array = field(default_factory=lambda: array("b"), repr=False)
+    range_kinds: list[RangeKind | None] = field(default_factory=list, repr=False)
+    data_types: list[LinkMLPrimitive | LinkMLElementName] = field(
+        default_factory=list, repr=False
+    )
+
+    _class_ids: dict[LinkMLClassName, int] = field(default_factory=dict, repr=False)
+    _range_ids: dict[LinkMLElementName | None, int] = field(
+        default_factory=dict, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.owners)
+
+    def _get_class_id(self, class_: CompiledClass | None) -> int:
+        if class_ is None:
+            return NONE
+
+        class_id = self._class_ids.get(class_.name)
+        if class_id is None:
+            class_id = self._class_ids[class_.name] = len(self.class_names)
+            self.class_names.append(class_.name)
+
+        return class_id
+
+    def _get_range_id(self, slot: CompiledSlot) -> int:
+        range_id = self._range_ids.get(slot.range)
+        if range_id is None:
+            range_id = self._range_ids[slot.range] = len(self.range_names)
+            self.range_names.append(slot.range)
+            self.range_is_class.append(isinstance(slot.range_element, CompiledClass))
+
+            resolved = self.ranges.resolve(slot.range)
+            if resolved is None:
+                self.range_kinds.append(None)
+                self.data_types.append(slot.range)
+            else:
+                self.range_kinds.append(resolved.kind)
+                self.data_types.append(
+                    resolved.primitive
+                    if resolved.kind is RangeKind.PRIMITIVE
+                    else resolved.name
+                )
+
+        return range_id
+
+    def _add_rows(self, slots: Iterable[CompiledSlot]) -> None:
+        start = len(self)
+
+        for slot in slots:
+            if slot in self.rows:
+                continue
+
+            self.rows[slot] = len(self.owners)
+            self.owners.append(self._get_class_id(slot.owner))
+            self.range_ids.append(self._get_range_id(slot))
+            self.required.append(_get_flag(slot.required))
+            self.multivalued.append(_get_flag(slot.multivalued))
+
+        range_ids = self.range_ids[start:]
+        self.relations.extend(array("b", map(self.range_is_class.__getitem__, range_ids)))
+        self.min_cardinalities.extend(
+            array("l", map(_get_min_cardinality, self.required[start:]))
+        )
+        self.max_cardinalities.extend(
+            array("l", map(_get_max_cardinality, self.multivalued[start:]))
+        )
+
+    def get_row(self, slot: CompiledSlot) -> int:
+        try:
+            return self.rows[slot]
+        except KeyError:
+            raise KeyError(f"Slot {slot.name!r} is not in the slot table") from None
+
+    def is_relation(self, slot: CompiledSlot) -> bool:
+        """Whether the range of the slot is a class."""
+
+        return bool(self.relations[self.get_row(slot)])
+
+    def get_data_type(self, slot: CompiledSlot) -> LinkMLPrimitive | LinkMLElementName:
+        """The primitive the range stands for, or else the name of the range."""
+
+        return self.data_types[self.range_ids[self.get_row(slot)]]
+
+    def get_data_type_kind(self, slot: CompiledSlot) -> RangeKind | None:
+        """What the range is, with the default range for a slot without one."""
+
+        return self.range_kinds[self.range_ids[self.get_row(slot)]]
+
+    def get_min_cardinality(self, slot: CompiledSlot) -> int:
+        return self.min_cardinalities[self.get_row(slot)]
+
+    def get_max_cardinality(self, slot: CompiledSlot) -> int | None:
+        """The maximum cardinality, or `None` for a multivalued slot."""
+
+        max_cardinality = self.max_cardinalities[self.get_row(slot)]
+
+        return None if max_cardinality == UNBOUNDED else max_cardinality
+
+
+def build_slot_table(
+    slots: Iterable[CompiledSlot], ranges: RangeRegistry
+) -> SlotTable:
+    """Tabulates the slots. Their `range_element` must be linked, and slots
+    refined by `slot_usage` must be among them."""
+
+    slot_table = SlotTable(ranges=ranges)
+    slot_table._add_rows(slots)
+
+    return slot_table
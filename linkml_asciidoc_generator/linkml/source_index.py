@@ -0,0 +1,318 @@
+import bisect
+import mmap
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from linkml_asciidoc_generator.linkml.model import LinkMLElementName
+from linkml_asciidoc_generator.linkml.read import read_linkml_schema_bytes
+
+
+INDEXED_SECTIONS = ("classes", "enums")
+
+# Patterns start at the newline before a key instead of using `^`, which
+# lets `re` skip ahead to candidate lines: several times faster on CIM.
+_SECTION_KEY = rb"([A-Za-z_][\w-]*):"
+_SECTION_PATTERN = re.compile(rb"\n" + _SECTION_KEY)
+_FIRST_SECTION_PATTERN = re.compile(_SECTION_KEY)
+_FIRST_KEY_PATTERN = re.compile(rb"\n( +)[^ #\r\n]")
+_REFERENCE_PATTERN = re.compile(rb" +(is_a|range): *['\"]?([^'\"\r\n]+?)['\"]? *\r?")
+_IS_A_PATTERN = re.compile(rb"\n +is_a: *['\"]?([^'\"\r\n]+?)['\"]? *\r?(?=\n|\Z)")
+
+
+class SourceSpan(NamedTuple):
+    start: int
+    end: int
+
+
+@dataclass(frozen=True)
+class SchemaSourceIndex:
+    """Where the blocks of a YAML schema file sit, by byte offset.
+
+    `header` holds the spans of all top-level sections except the indexed
+    ones. The indexed sections map each element name to the span of its
+    block.
+    """
+
+    schema_file: Path
+    size: int
+    mtime_ns: int
+    header: tuple[SourceSpan, ...]
+    classes: dict[LinkMLElementName, SourceSpan]
+    enums: dict[LinkMLElementName, SourceSpan]
+
+    def is_stale(self) -> bool:
+        stat = self.schema_file.stat()
+
+        return (stat.st_size, stat.st_mtime_ns) != (self.size, self.mtime_ns)
+
+
+def _index_section(
+    source: mmap.mmap, start: int, end: int
+) -> dict[LinkMLElementName, SourceSpan]:
+    first_key = _FIRST_KEY_PATTERN.search(source, start, end)
+    if first_key is None:
+        return {}
+
+    indent = re.escape(first_key.group(1))
+    key_pattern = re.compile(
+        rb"\n" + indent + rb"(?:'([^']+)'|\"([^\"]+)\"|([^ #'\"\r\n][^:\r\n]*)):"
+    )
+
+    keys = [
+        ((m.group(1) or m.group(2) or m.group(3)).decode("utf8"), m.start() + 1)
+        for m in key_pattern.finditer(source, start, end)
+    ]
+
+    return {
+        name: SourceSpan(key_start, next_start)
+        for (name, key_start), (_, next_start) in zip(keys, keys[1:] + [("", end)])
+    }
+
+
+def index_linkml_schema_source(schema_file: Path) -> SchemaSourceIndex:
+    """Indexes the top-level sections and the class and enum blocks of the
+    schema file.
+
+    This only scans the file for keys; none of the YAML is parsed. It relies
+    on block-style YAML, as written by LinkML tooling, without anchors that
+    cross blocks.
+    """
+
+    stat = schema_file.stat()
+
+    with schema_file.open(mode="rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as source:
+        sections = [
+            (m.group(1).decode("utf8"), m.start() + 1)
+            for m in _SECTION_PATTERN.finditer(source)
+        ]
+        if m := _FIRST_SECTION_PATTERN.match(source):
+            sections.insert(0, (m.group(1).decode("utf8"), 0))
+
+        header = []
+        indexed = {section: {} for section in INDEXED_SECTIONS}
+        for (section, start), (_, end) in zip(
+            sections, sections[1:] + [("", len(source))]
+        ):
+            if section in indexed:
+                indexed[section] = _index_section(source, start, end)
+            else:
+                header.append(SourceSpan(start, end))
+
+    return SchemaSourceIndex(
+        schema_file=schema_file,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        header=tuple(header),
+        **indexed,
+    )
+
+
+def _load_blocks(source: mmap.mmap, spans: Iterable[SourceSpan]) -> dict:
+    return read_linkml_schema_bytes(b"".join(source[s.start : s.end] for s in spans)) or {}
+
+
+def _get_referrers(
+    source: mmap.mmap,
+    source_index: SchemaSourceIndex,
+    names: Iterable[LinkMLElementName],
+    fields: tuple[str, ...] = ("is_a", "range"),
+) -> set[LinkMLElementName]:
+    """Classes with a block that uses one of the names as value of one of the
+    fields (`is_a` or `range`)."""
+
+    encoded_fields = {field_name.encode("utf8") for field_name in fields}
+
+    class_names = list(source_index.classes)
+    class_starts = [span.start for span in source_index.classes.values()]
+
+    referrers = set()
+    for name in names:
+        encoded_name = name.encode("utf8")
+
+        # Find the name anywhere, then check the line it is on.
+        for m in re.finditer(re.escape(encoded_name), source):
+            line_start = source.rfind(b"\n", 0, m.start()) + 1
+            line_end = source.find(b"\n", m.end())
+            line = _REFERENCE_PATTERN.fullmatch(
+                source, line_start, len(source) if line_end == -1 else line_end
+            )
+            if (
+                line is None
+                or line.group(1) not in encoded_fields
+                or line.group(2) != encoded_name
+            ):
+                continue
+
+            i = bisect.bisect_right(class_starts, line_start) - 1
+            if i >= 0 and line_start < source_index.classes[class_names[i]].end:
+                referrers.add(class_names[i])
+
+    return referrers
+
+
+def _get_slot_users(
+    source: mmap.mmap,
+    source_index: SchemaSourceIndex,
+    slot_names: Iterable[LinkMLElementName],
+) -> set[LinkMLElementName]:
+    """Classes with a block that lists one of the global slots as item.
+
+    Items of other lists of a class block count too, which only adds
+    classes that are not needed.
+    """
+
+    class_names = list(source_index.classes)
+    class_starts = [span.start for span in source_index.classes.values()]
+
+    users = set()
+    for slot_name in slot_names:
+        item_pattern = re.compile(
+            rb"\n +- *['\"]?" + re.escape(slot_name.encode("utf8")) + rb"['\"]? *\r?(?=\n|\Z)"
+        )
+        for m in item_pattern.finditer(source):
+            line_start = m.start() + 1
+            i = bisect.bisect_right(class_starts, line_start) - 1
+            if i >= 0 and line_start < source_index.classes[class_names[i]].end:
+                users.add(class_names[i])
+
+    return users
+
+
+def _get_children(
+    source: mmap.mmap, source_index: SchemaSourceIndex
+) -> dict[LinkMLElementName, set[LinkMLElementName]]:
+    """Classes by the name they have as `is_a`, from one scan of the file.
+
+    `is_a` of slots inside a class block counts too, which only adds
+    classes that are not needed.
+    """
+
+    class_names = list(source_index.classes)
+    class_starts = [span.start for span in source_index.classes.values()]
+
+    children = {}
+    for m in _IS_A_PATTERN.finditer(source):
+        line_start = m.start() + 1
+        i = bisect.bisect_right(class_starts, line_start) - 1
+        if i >= 0 and line_start < source_index.classes[class_names[i]].end:
+            children.setdefault(m.group(1).decode("utf8"), set()).add(class_names[i])
+
+    return children
+
+
+def _get_slot_ranges(class_: dict, global_slots: dict) -> set[LinkMLElementName]:
+    """Ranges of the attributes, slots and slot usage of a class block."""
+
+    slots = [
+        *(class_.get("attributes") or {}).values(),
+        *(class_.get("slot_usage") or {}).values(),
+        *(global_slots.get(name) for name in class_.get("slots") or []),
+    ]
+
+    return {slot["range"] for slot in slots if slot and slot.get("range")}
+
+
+def read_linkml_schema_subset(
+    source_index: SchemaSourceIndex,
+    names: Iterable[LinkMLElementName],
+    polymorphic_used_by: bool = False,
+    hierarchy_depth: int | None = 1,
+    relation_hops: int = 1,
+) -> dict:
+    """Reads the schema dictionary with only the blocks the named classes and
+    enums need.
+
+    Those are the named elements and their ancestors and mixins, plus, as
+    far as the pages of the named elements refer to them: the ranges of
+    their slots, the classes that inherit from them (`hierarchy_depth`
+    levels down, or all of them for 0 or `None`), and the classes that use
+    them as range. With `polymorphic_used_by`, classes that use one of
+    their ancestors as range are included too, and with `relation_hops`
+    above 1, the classes that many relations away.
+    """
+
+    names = set(names)
+    unknown = names - source_index.classes.keys() - source_index.enums.keys()
+    if unknown:
+        raise KeyError(f"Not a class or enum of {source_index.schema_file}: {', '.join(sorted(unknown))}")
+
+    with source_index.schema_file.open(mode="rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as source:
+        schema_dict = _load_blocks(source, source_index.header)
+
+        global_slots = schema_dict.get("slots") or {}
+        classes = {}
+
+        def _load_lineages(pending: list[LinkMLElementName]) -> list[LinkMLElementName]:
+            """Loads the classes and everything they inherit from, and returns
+            the names of the classes that were not loaded yet."""
+
+            loaded = []
+            while pending:
+                name = pending.pop()
+                if name in classes or name not in source_index.classes:
+                    continue
+
+                class_ = _load_blocks(source, [source_index.classes[name]])[name] or {}
+                classes[name] = class_
+                loaded.append(name)
+                pending.extend([class_.get("is_a"), *(class_.get("mixins") or [])])
+
+            return loaded
+
+        # Classes of which the slots are shown: the named ones and everything
+        # they inherit from. Relations diagrams of more than one hop also show
+        # the relations of the classes up to one hop before their edge.
+        expanded = _load_lineages([name for name in names if name in source_index.classes])
+        for _ in range(relation_hops - 1):
+            targets = {
+                range_name
+                for name in expanded
+                for range_name in _get_slot_ranges(classes[name], global_slots)
+            }
+            expanded = _load_lineages(sorted(targets))
+
+        # Elements that only have to be there to be linked to, starting with
+        # subclasses, as many levels down as the class hierarchy shows.
+        children = _get_children(source, source_index)
+        referenced = set()
+        subclasses = names
+        depth = 0
+        while subclasses and (not hierarchy_depth or depth < hierarchy_depth):
+            subclasses = {c for n in subclasses for c in children.get(n, ())} - referenced
+            referenced |= subclasses
+            depth += 1
+
+        used_ranges = names | classes.keys() if polymorphic_used_by else names
+        referenced |= _get_referrers(source, source_index, used_ranges, ("range",))
+        referenced |= _get_slot_users(
+            source,
+            source_index,
+            [name for name, slot in global_slots.items() if slot and slot.get("range") in used_ranges],
+        )
+        for class_ in classes.values():
+            referenced |= _get_slot_ranges(class_, global_slots)
+        referenced |= {name for name in names if name in source_index.enums}
+
+        referenced_classes = referenced.intersection(source_index.classes).difference(classes)
+        classes |= _load_blocks(
+            source,
+            [span for name, span in source_index.classes.items() if name in referenced_classes],
+        )
+        enums = _load_blocks(
+            source,
+            [span for name, span in source_index.enums.items() if name in referenced],
+        )
+
+    # Keep the order of the file, like a full read does.
+    schema_dict["classes"] = {
+        name: classes[name] for name in source_index.classes if name in classes
+    }
+    schema_dict["enums"] = enums
+
+    return schema_dict
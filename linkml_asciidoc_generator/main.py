@@ -1,62 +1,214 @@
 import argparse
+import logging
 import sys
+import time
 
+from dataclasses import dataclass
 from pathlib import Path
-from linkml_asciidoc_generator.linkml.read import read_linkml_schema
-from linkml_asciidoc_generator.linkml.parse import parse_linkml_schema
+from linkml_asciidoc_generator.linkml.load import (
+    load_linkml_schema,
+    load_linkml_schema_subset,
+)
+from linkml_asciidoc_generator.linkml.read import is_linkml_schema_json
+from linkml_asciidoc_generator.linkml.compile import compile_linkml_schema
+from linkml_asciidoc_generator.linkml.cache import DEFAULT_CACHE_DIR
+from linkml_asciidoc_generator.linkml.parse import ParseMode
+from linkml_asciidoc_generator.linkml.model import CompiledSchema, Metamodel
 from linkml_asciidoc_generator.asciidoc.linkml_documentation.generate import (
     generate_linkml_documentation,
 )
 from linkml_asciidoc_generator.asciidoc.linkml_documentation.render import (
     render_linkml_documentation,
 )
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.prune import (
+    get_pruned_config,
+)
+from linkml_asciidoc_generator.asciidoc.linkml_documentation.stream import (
+    iter_linkml_documentation,
+)
 from linkml_asciidoc_generator.asciidoc.linkml_documentation.write import (
     write_linkml_documentation,
+    write_pages,
 )
 from linkml_asciidoc_generator.config import Config
 
 
-def create_linkml_documentation(schema_file: Path, config: Config) -> None:
-    schema_dict = read_linkml_schema(schema_file)
-    schema = parse_linkml_schema(schema_dict)
-    linkml_documentation = generate_linkml_documentation(schema, config)
-    linkml_documentation_adoc = render_linkml_documentation(
-        linkml_documentation, config
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATES_DIR = Path(__file__).parent / "asciidoc" / "templates"
+
+
+@dataclass
+class BuildTimings:
+    schema_file: Path
+    load: float = 0.0
+    compile: float = 0.0
+    generate: float = 0.0
+    render: float = 0.0
+    write: float = 0.0
+
+    @property
+    def total(self) -> float:
+        return self.load + self.compile + self.generate + self.render + self.write
+
+
+def _stream_linkml_documentation(
+    schema: CompiledSchema, config: Config, timings: BuildTimings
+) -> None:
+    """Generates, renders and writes one page at a time. The stages take
+    turns, so each stage's time is the sum of its turns."""
+
+    start = time.perf_counter()
+
+    stage_times = {"generate": 0.0, "render": 0.0}
+    write_pages(iter_linkml_documentation(schema, config, stage_times), config)
+
+    timings.generate = stage_times["generate"]
+    timings.render = stage_times["render"]
+    timings.write = time.perf_counter() - start - timings.generate - timings.render
+
+
+def create_linkml_documentation(schema_file: Path, config: Config) -> BuildTimings:
+    timings = BuildTimings(schema_file)
+
+    start = time.perf_counter()
+    if (
+        config.get("only")
+        and schema_file.is_file()
+        and not is_linkml_schema_json(schema_file)
+    ):
+        linkml_schema = load_linkml_schema_subset(schema_file, config["only"], config)
+    else:
+        linkml_schema = load_linkml_schema(schema_file, config)
+    timings.load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    schema = compile_linkml_schema(linkml_schema)
+    config = get_pruned_config(schema, config)
+    timings.compile = time.perf_counter() - start
+
+    if config.get("stream"):
+        _stream_linkml_documentation(schema, config, timings)
+    else:
+        start = time.perf_counter()
+        linkml_documentation = generate_linkml_documentation(schema, config)
+        timings.generate = time.perf_counter() - start
+
+        start = time.perf_counter()
+        linkml_documentation_adoc = render_linkml_documentation(
+            linkml_documentation, config
+        )
+        timings.render = time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_linkml_documentation(linkml_documentation_adoc, config)
+        timings.write = time.perf_counter() - start
+
+    logger.info(
+        "Built %s in %.3f s (load %.3f s, compile %.3f s, generate %.3f s,"
+        " render %.3f s, write %.3f s)",
+        schema_file,
+        timings.total,
+        timings.load,
+        timings.compile,
+        timings.generate,
+        timings.render,
+        timings.write,
     )
-    write_linkml_documentation(linkml_documentation_adoc, config)
 
     # pprint(linkml_documentation.class_pages["MarketEvaluationPoint"].relations_diagram)
 
+    return timings
 
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser()
-    parser.add_argument("schema", help="path to the LinkML schema", type=Path)
-    parser.add_argument("-o", "--output-dir", help="output directory path to write Antora module to", default=Path("./output"), type=Path)
-    parser.add_argument("-t", "--templates-dir", help="path to (custom) Jinja2 templates for rendering the AsciiDco", default=Path(__file__).parent / 'asciidoc' / 'templates', type=Path)
+
+def add_build_arguments(parser: argparse.ArgumentParser) -> None:
+    """Adds the options shared by the single-schema and batch entry points."""
+
+    parser.add_argument("-t", "--templates-dir", help="path to (custom) Jinja2 templates for rendering the AsciiDco", default=DEFAULT_TEMPLATES_DIR, type=Path)
     parser.add_argument("--render-diagrams", help="whether to render relation diagrams or not", action="store_true")
+    parser.add_argument("--hierarchy-depth", help="how many levels of subclasses the class hierarchy shows, 0 for all (default: 1)", default=1, type=int, metavar="N")
+    parser.add_argument("--relation-hops", help="how many relations away from the class the relations diagram goes (default: 1)", default=1, type=int, metavar="N")
+    parser.add_argument("--polymorphic-used-by", help="also list on class pages where a class is used through a slot with one of its superclasses as range", action="store_true")
+    parser.add_argument("-I", "--import-path", help="directory to search for imported schemas (can be given more than once)", action="append", default=[], type=Path)
+    parser.add_argument("--no-imports", help="do not resolve and merge the schema's imports", action="store_true")
+    parser.add_argument("--parse-mode", help="'trusted' skips validation of the schema with the full metamodel; only use it for schemas validated upstream", choices=[m.value for m in ParseMode], default=ParseMode.STRICT.value)
+    parser.add_argument("--full-metamodel", help="validate into the full LinkML metamodel instead of the projection of the fields the generator reads", action="store_true")
+    parser.add_argument("--no-cache", help="always read and parse the schema instead of using the parsed-schema cache", action="store_true")
+    parser.add_argument("--cache-dir", help="directory for the parsed-schema cache", default=DEFAULT_CACHE_DIR, type=Path)
+    parser.add_argument("--only", help="only generate the page of this class or enum, reading just the parts of the schema it needs (can be given more than once)", action="append", default=[], metavar="NAME")
+    parser.add_argument("--prune", help="only generate pages for the classes reachable from the tree_root class through relations, superclasses and mixins, and for the enums and types they use", action="store_true")
+    parser.add_argument("--seed", help="prune from this class instead of the tree_root class (can be given more than once; implies --prune)", action="append", default=[], metavar="CLASS")
+    parser.add_argument("--external-module", help="Antora 'component:module' with the pages that a pruned build leaves out, to link to them there instead of naming them without a link", metavar="COORDINATES")
+    parser.add_argument("-j", "--jobs", help="generate and render class and enumeration pages in this many processes (default: 1)", default=1, type=int, metavar="N")
+    parser.add_argument("--stream", help="generate, render and write one page at a time instead of all pages per stage, keeping memory use flat; runs in one process, so --jobs does not apply", action="store_true")
+    parser.add_argument("-v", "--verbose", help="log which YAML loader ran and how long each stage took", action="store_true")
 
-    args = parser.parse_args()
 
+def get_config(args: argparse.Namespace, output_dir: Path) -> Config:
     config = {
         "templates": {
             "dir": args.templates_dir,
             "class_page": "class_page/class_page.adoc.jinja2",
             "enumeration_page": "enumeration_page.adoc.jinja2",
             "cim_data_type_page": "class_page/cim_data_type_page.adoc.jinja2",
+            "type_page": "type_page.adoc.jinja2",
             "class_page_relations_diagram": "class_page/relations_diagram.adoc.jinja2",
             "index_page": "index_page.adoc.jinja2",
             "navigation_page": "navigation_page.adoc.jinja2",
         },
         "diagrams": {
             "relations": args.render_diagrams,
+            "relation_hops": args.relation_hops,
             "class_color": {
                 "IEC61970 (Grid)": "#eccfcb",
                 "IEC61968 (Enterprise)": "#d1e7c2",
                 "IEC62325 (Market)": "#fffbef",
             },
         },
-        "output_dir": args.output_dir,
+        "class_hierarchy": {
+            "depth": args.hierarchy_depth,
+        },
+        "used_by": {
+            "polymorphic": args.polymorphic_used_by,
+        },
+        "imports": {
+            "resolve": not args.no_imports,
+            "search_paths": args.import_path,
+        },
+        "parse_mode": ParseMode(args.parse_mode),
+        "metamodel": Metamodel.FULL if args.full_metamodel else Metamodel.PROJECTION,
+        "cache": {
+            "enabled": not args.no_cache,
+            "dir": args.cache_dir,
+        },
+        "only": set(args.only),
+        "prune": {
+            "enabled": args.prune or bool(args.seed),
+            "seeds": set(args.seed),
+            "external_module": args.external_module,
+        },
+        "jobs": args.jobs,
+        "stream": args.stream,
+        "output_dir": output_dir,
         "char_encoding": "utf8",
     }
 
+    return config
+
+
+def configure_logging(args: argparse.Namespace) -> None:
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("schema", help="path to the LinkML schema, or to a directory of fragments of one", type=Path)
+    parser.add_argument("-o", "--output-dir", help="output directory path to write Antora module to", default=Path("./output"), type=Path)
+    add_build_arguments(parser)
+
+    args = parser.parse_args()
+
+    configure_logging(args)
+    config = get_config(args, args.output_dir)
+
     create_linkml_documentation(args.schema, config=config)